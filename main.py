@@ -21,11 +21,394 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QGroupBox, QGridLayout)
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtOpenGLWidgets import QOpenGLWidget
-from PyQt6.QtGui import QPainter, QFont, QColor
+from PyQt6.QtGui import QPainter, QFont, QColor, QPixmap, QStaticText, QTransform
 from OpenGL.GL import *
-from OpenGL.GLU import *
+from OpenGL.GL import shaders
+from OpenGL.arrays import vbo
+import ctypes
 import math
 
+# ============================================================================
+# TABELAS DE GEOMETRIA ESTÁTICA
+# ============================================================================
+# Usadas apenas na construção dos VBOs (initializeGL); o caminho de desenho
+# acessa somente os buffers já enviados para a GPU.
+
+# Cubo centrado na origem com lado de 2 unidades
+_CUBE_VERTS = (
+    (-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1),  # Traseira
+    (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1)       # Frontal
+)
+
+# Faces em ordem anti-horária vista de fora (GL_CCW, para o backface
+# culling); o último vértice de cada face é o provoking vertex do GL_FLAT
+_CUBE_FACES = (
+    (2, 1, 0, 3),  # Traseira
+    (4, 5, 6, 7),  # Frontal
+    (0, 1, 5, 4),  # Inferior
+    (2, 3, 7, 6),  # Superior
+    (7, 3, 0, 4),  # Esquerda
+    (1, 2, 6, 5)   # Direita
+)
+
+_CUBE_NORMALS = (
+    (0, 0, -1),   # Traseira
+    (0, 0, 1),    # Frontal
+    (0, -1, 0),   # Inferior
+    (0, 1, 0),    # Superior
+    (-1, 0, 0),   # Esquerda
+    (1, 0, 0)     # Direita
+)
+
+# Pirâmide: ápice em y=1.5 e base quadrada em y=-0.5
+_PYRAMID_APEX = (0, 1.5, 0)
+_PYRAMID_BASE = (
+    (-1, -0.5, 1),
+    (1, -0.5, 1),
+    (1, -0.5, -1),
+    (-1, -0.5, -1)
+)
+
+# Eixos de coordenadas (X, Y, Z) com 2 unidades a partir da origem
+_AXES_VERTS = (
+    (0, 0, 0), (2, 0, 0),
+    (0, 0, 0), (0, 2, 0),
+    (0, 0, 0), (0, 0, 2)
+)
+
+# Quad (a, b, c, d) -> triângulos (a, b, d) e (b, c, d): ambos
+# terminam em d, o provoking vertex do quad no GL_FLAT
+_QUAD_SPLIT = (0, 1, 3, 1, 2, 3)
+
+
+def _pyramid_triangles():
+    """
+    Expande a pirâmide em triângulos independentes com normais por vértice.
+    
+    As 4 normais laterais são obtidas de uma só vez com produtos vetoriais
+    vetorizados (np.cross) e replicadas para os 3 vértices de cada face; a
+    base entra como 2 triângulos com normal (0, -1, 0). Chamado uma única
+    vez, na criação dos VBOs.
+    
+    Returns:
+        tuple: (posições, normais), ambos np.ndarray float32 de forma (18, 3)
+    """
+    apex = np.array(_PYRAMID_APEX, dtype=np.float32)
+    base = np.array(_PYRAMID_BASE, dtype=np.float32)
+    next_base = np.roll(base, -1, axis=0)
+    
+    normals = np.cross(base - apex, next_base - apex)
+    normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+    
+    lateral = np.stack([np.broadcast_to(apex, base.shape), base, next_base], axis=1)
+    base_quad = base[::-1][list(_QUAD_SPLIT)]
+    
+    positions = np.concatenate([lateral.reshape(-1, 3), base_quad])
+    vertex_normals = np.concatenate([np.repeat(normals, 3, axis=0),
+                                     np.tile([0, -1, 0], (6, 1))])
+    return positions.astype(np.float32), vertex_normals.astype(np.float32)
+
+
+def _grid_indices(rows, cols, corner):
+    """
+    Índices de triângulos para uma malha regular de (rows + 1) x (cols + 1) vértices.
+    
+    Os cantos de cada célula são tomados na ordem (v00, v10, v11, v01)
+    girada de `corner` posições, formando (a, b, c, d), que vira os
+    triângulos (a, b, d) e (b, c, d). Ambos terminam em d, o vértice que
+    define a cor no GL_FLAT; `corner` permite escolher o mesmo vértice
+    que o GLU usava, preservando o sombreamento flat.
+    
+    Args:
+        rows (int): Número de células na direção das linhas
+        cols (int): Número de células na direção das colunas
+        corner (int): Rotação (0 a 3) dos cantos de cada célula
+        
+    Returns:
+        np.ndarray: Índices uint32 de forma (rows * cols * 6,)
+    """
+    r, c = np.meshgrid(np.arange(rows), np.arange(cols), indexing='ij')
+    v00 = r * (cols + 1) + c
+    v10 = v00 + (cols + 1)
+    cells = np.stack([v00, v10, v10 + 1, v00 + 1], axis=-1).reshape(-1, 4)
+    cells = np.roll(cells, -corner, axis=1)
+    return cells[:, list(_QUAD_SPLIT)].astype(np.uint32).ravel()
+
+
+def _make_sphere(radius, slices, stacks):
+    """
+    Gera uma esfera centrada na origem, com a mesma parametrização do gluSphere
+    (polos em +Z e -Z).
+    
+    As tabelas de seno/cosseno de latitude (stacks) e longitude (slices) são
+    combinadas por produto externo, sem laços em Python.
+    
+    Args:
+        radius (float): Raio da esfera
+        slices (int): Subdivisões em torno do eixo Z
+        stacks (int): Subdivisões ao longo do eixo Z
+        
+    Returns:
+        tuple: (posições, normais, índices) em np.ndarray float32/float32/uint32
+    """
+    rho = np.linspace(0, math.pi, stacks + 1)[:, None]
+    theta = np.linspace(0, 2 * math.pi, slices + 1)[None, :]
+    
+    normals = np.stack([
+        -np.sin(theta) * np.sin(rho),
+        np.cos(theta) * np.sin(rho),
+        np.broadcast_to(np.cos(rho), (stacks + 1, slices + 1)),
+    ], axis=-1).reshape(-1, 3)
+    
+    return ((normals * radius).astype(np.float32), normals.astype(np.float32),
+            _grid_indices(stacks, slices, corner=1))
+
+
+def _make_cylinder(radius, height, slices, stacks):
+    """
+    Gera um cilindro fechado ao longo de +Z (de z=0 a z=height), equivalente
+    a gluCylinder + dois gluDisk nas extremidades.
+    
+    Args:
+        radius (float): Raio do cilindro
+        height (float): Altura do cilindro
+        slices (int): Subdivisões em torno do eixo Z
+        stacks (int): Subdivisões ao longo do eixo Z
+        
+    Returns:
+        tuple: (posições, normais, índices) em np.ndarray float32/float32/uint32
+    """
+    theta = np.linspace(0, 2 * math.pi, slices + 1)
+    ring = np.column_stack([np.sin(theta), np.cos(theta), np.zeros_like(theta)])
+    z = np.linspace(0, height, stacks + 1)
+    
+    # Corpo: anéis empilhados, normal radial
+    body_pos = np.tile(ring * radius, (stacks + 1, 1))
+    body_pos[:, 2] = np.repeat(z, slices + 1)
+    body_nrm = np.tile(ring, (stacks + 1, 1))
+    body_idx = _grid_indices(stacks, slices, corner=3)
+    
+    # Tampas: centro + anel, em leque. O anel (sin, cos) gira no sentido
+    # horário visto de +Z, então a tampa superior inverte a ordem para que
+    # as duas fiquem anti-horárias vistas de fora
+    n = len(body_pos)
+    fan = np.column_stack([np.zeros(slices, dtype=np.int64),
+                           np.arange(1, slices + 1), np.arange(2, slices + 2)])
+    caps_pos, caps_nrm, caps_idx = [], [], []
+    for cap_z, normal_z, tri in ((0.0, -1.0, fan), (height, 1.0, fan[:, ::-1])):
+        rim = ring * radius
+        rim[:, 2] = cap_z
+        caps_pos.append(np.vstack([[0, 0, cap_z], rim]))
+        caps_nrm.append(np.tile([0, 0, normal_z], (slices + 2, 1)))
+        caps_idx.append(tri.ravel() + n)
+        n += slices + 2
+    
+    positions = np.concatenate([body_pos] + caps_pos).astype(np.float32)
+    normals = np.concatenate([body_nrm] + caps_nrm).astype(np.float32)
+    indices = np.concatenate([body_idx] + caps_idx).astype(np.uint32)
+    return positions, normals, indices
+
+
+def _perspective(fovy, aspect, near, far):
+    """
+    Matriz de projeção perspectiva (equivalente a gluPerspective).
+    
+    Returns:
+        np.ndarray: Matriz 4x4 float32 (row-major)
+    """
+    f = 1.0 / math.tan(math.radians(fovy) / 2)
+    return np.array([
+        [f / aspect, 0, 0, 0],
+        [0, f, 0, 0],
+        [0, 0, (far + near) / (near - far), 2 * far * near / (near - far)],
+        [0, 0, -1, 0],
+    ], dtype=np.float32)
+
+
+def _orthographic(left, right, bottom, top, near, far):
+    """
+    Matriz de projeção ortográfica (equivalente a glOrtho).
+    
+    Returns:
+        np.ndarray: Matriz 4x4 float32 (row-major)
+    """
+    return np.array([
+        [2 / (right - left), 0, 0, -(right + left) / (right - left)],
+        [0, 2 / (top - bottom), 0, -(top + bottom) / (top - bottom)],
+        [0, 0, -2 / (far - near), -(far + near) / (far - near)],
+        [0, 0, 0, 1],
+    ], dtype=np.float32)
+
+
+def _look_at(eye, target, up):
+    """
+    Matriz de visualização (equivalente a gluLookAt).
+    
+    Args:
+        eye (tuple): Posição da câmera
+        target (tuple): Ponto observado
+        up (tuple): Vetor "para cima"
+        
+    Returns:
+        np.ndarray: Matriz 4x4 float32 (row-major)
+    """
+    eye = np.asarray(eye, dtype=np.float64)
+    forward = np.asarray(target, dtype=np.float64) - eye
+    forward /= np.linalg.norm(forward)
+    side = np.cross(forward, up)
+    side /= np.linalg.norm(side)
+    true_up = np.cross(side, forward)
+    
+    m = np.identity(4)
+    m[0, :3], m[1, :3], m[2, :3] = side, true_up, -forward
+    m[:3, 3] = -m[:3, :3] @ eye
+    return m.astype(np.float32)
+
+
+# ============================================================================
+# SHADERS GLSL (FLAT / GOURAUD / PHONG)
+# ============================================================================
+# Um programa por modelo, especializado em tempo de compilação pela macro
+# SHADING_MODE (inserida por _shader_source), sem desvio por uniform:
+#   0 = Flat    -> iluminação por vértice + glShadeModel(GL_FLAT), que no
+#                  perfil de compatibilidade também vale para gl_FrontColor
+#   1 = Gouraud -> iluminação por vértice, cor interpolada
+#   2 = Phong   -> normal interpolada, iluminação por fragmento
+# A luz e o material vêm do estado fixo (gl_LightSource, gl_FrontMaterial) e a
+# cor difusa/ambiente de gl_Color, como no GL_COLOR_MATERIAL configurado em
+# initializeGL. O especular usa o observador no infinito (padrão do OpenGL).
+
+# Equação de iluminação compartilhada pelos dois estágios
+_SHADE_FUNCTION = """
+vec4 shade(vec3 P, vec3 N, vec4 color)
+{
+    vec3 L = normalize(gl_LightSource[0].position.xyz - P);
+    vec3 H = normalize(L + vec3(0.0, 0.0, 1.0));
+    float diff = max(dot(N, L), 0.0);
+    float spec = diff > 0.0 ? pow(max(dot(N, H), 0.0), gl_FrontMaterial.shininess) : 0.0;
+    
+    vec3 result = (gl_LightModel.ambient.rgb + gl_LightSource[0].ambient.rgb) * color.rgb
+                + gl_LightSource[0].diffuse.rgb * color.rgb * diff
+                + gl_LightSource[0].specular.rgb * gl_FrontMaterial.specular.rgb * spec;
+    return vec4(clamp(result, 0.0, 1.0), color.a);
+}
+"""
+
+SHADING_VERTEX_SHADER = """
+varying vec3 vPosition;  // Posição no espaço do olho
+varying vec3 vNormal;    // Normal no espaço do olho
+varying vec4 vColor;     // Cor base (GL_AMBIENT_AND_DIFFUSE)
+""" + _SHADE_FUNCTION + """
+void main()
+{
+    vPosition = vec3(gl_ModelViewMatrix * gl_Vertex);
+    vNormal = normalize(gl_NormalMatrix * gl_Normal);
+    vColor = gl_Color;
+    
+#if SHADING_MODE == 2
+    gl_FrontColor = gl_Color;
+#else
+    // Flat e Gouraud: iluminação calculada no vértice
+    gl_FrontColor = shade(vPosition, vNormal, gl_Color);
+#endif
+    
+    gl_Position = ftransform();
+}
+"""
+
+SHADING_FRAGMENT_SHADER = """
+varying vec3 vPosition;
+varying vec3 vNormal;
+varying vec4 vColor;
+""" + _SHADE_FUNCTION + """
+void main()
+{
+#if SHADING_MODE == 2
+    gl_FragColor = shade(vPosition, normalize(vNormal), vColor);  // Phong
+#else
+    gl_FragColor = gl_Color;  // Flat / Gouraud (cor do vértice)
+#endif
+}
+"""
+
+
+def _shader_source(source, mode):
+    """
+    Especializa um shader para um modelo de iluminação.
+    
+    Args:
+        source (str): SHADING_VERTEX_SHADER ou SHADING_FRAGMENT_SHADER
+        mode (int): Valor de SHADING_MODE (ver _SHADING_MODES)
+        
+    Returns:
+        str: Código GLSL 1.20 com a macro SHADING_MODE definida
+    """
+    return f"#version 120\n#define SHADING_MODE {mode}\n" + source
+
+# Luz e material em float32 contíguo: o PyOpenGL passa o buffer direto
+# para glLightfv/glMaterialfv, sem converter listas a cada chamada
+_LIGHT_AMBIENT = np.array([0.3, 0.3, 0.3, 1.0], dtype=np.float32)
+_LIGHT_DIFFUSE = np.array([0.8, 0.8, 0.8, 1.0], dtype=np.float32)
+_LIGHT_SPECULAR = np.array([1.0, 1.0, 1.0, 1.0], dtype=np.float32)
+_MATERIAL_AMBIENT = np.array([0.2, 0.2, 0.2, 1.0], dtype=np.float32)
+_MATERIAL_DIFFUSE = np.array([0.8, 0.8, 0.8, 1.0], dtype=np.float32)
+_MATERIAL_SPECULAR = np.array([1.0, 1.0, 1.0, 1.0], dtype=np.float32)
+
+# Quantização dos VBOs: posições em int16 com passo de 1/4096 (faixa de
+# +-8 unidades, a grade vai até 5), normais em int16 normalizado pelo
+# OpenGL para [-1, 1] e cores em uint8
+_POSITION_SCALE = 1.0 / 4096
+_NORMAL_SCALE = 32767
+_COLOR_SCALE = 255
+
+# Valor da macro SHADING_MODE de cada programa
+_SHADING_MODES = {'flat': 0, 'gouraud': 1, 'phong': 2}
+
+
+# Bloco de estado numérico do widget (SoA): um único array float32 com
+# offsets nomeados, fatiado por grupo na composição de matrizes
+_STATE_OFFSETS = {
+    'rot_x': 0, 'rot_y': 1, 'rot_z': 2,
+    'scale': 3,
+    'trans_x': 4, 'trans_y': 5, 'trans_z': 6,
+    'light_x': 7, 'light_y': 8, 'light_z': 9, 'light_w': 10,
+    'cam_dist': 11, 'cam_angle_x': 12, 'cam_angle_y': 13,
+}
+_STATE_SIZE = 16
+_STATE_ROTATION = slice(0, 3)
+_STATE_TRANSLATION = slice(4, 7)
+_STATE_LIGHT = slice(7, 11)
+_STATE_CAMERA = slice(11, 14)
+
+
+def _state_field(name, doc, dirty_flag=None):
+    """
+    Cria uma propriedade que lê/escreve uma posição do bloco self._state.
+    
+    Toda escrita marca self.needs_redraw.
+    
+    Args:
+        name (str): Chave em _STATE_OFFSETS
+        doc (str): Docstring da propriedade
+        dirty_flag (str, optional): Atributo marcado como True a cada escrita
+        
+    Returns:
+        property: Descritor pronto para ser usado como atributo de classe
+    """
+    offset = _STATE_OFFSETS[name]
+    
+    def getter(self):
+        return float(self._state[offset])
+    
+    def setter(self, value):
+        self._state[offset] = value
+        self.needs_redraw = True
+        if dirty_flag:
+            setattr(self, dirty_flag, True)
+    
+    return property(getter, setter, doc=doc)
+
+
 class OpenGLWidget(QOpenGLWidget):
     """
     Widget OpenGL para renderização 3D de objetos com iluminação.
@@ -49,7 +432,7 @@ class OpenGLWidget(QOpenGLWidget):
         camera_angle_x (float): Ângulo vertical da câmera (em graus)
         camera_angle_y (float): Ângulo horizontal da câmera (em graus)
         shading_model (str): Modelo de iluminação atual ('flat', 'gouraud', 'phong')
-        light_pos (list): Posição da luz [x, y, z, w] onde w=1 para luz posicional
+        light_pos (np.ndarray): Posição da luz float32 [x, y, z, w] onde w=1 para luz posicional
         object_type (str): Tipo de objeto a renderizar ('cube', 'pyramid', 'cone', 'sphere')
         projection_type (str): Tipo de projeção ('perspective', 'orthographic')
         comparison_mode (bool): Se True, mostra 3 objetos com diferentes iluminações
@@ -65,6 +448,17 @@ class OpenGLWidget(QOpenGLWidget):
             parent (QWidget, optional): Widget pai. Default é None.
         """
         super().__init__(parent)
+        # paintGL sempre limpa e redesenha a cena: o Qt não precisa
+        # invalidar o framebuffer do widget antes de cada frame
+        self.setUpdateBehavior(QOpenGLWidget.UpdateBehavior.PartialUpdate)
+        
+        # Estado numérico contíguo (ver _STATE_OFFSETS); os atributos
+        # rotation_x, scale_factor, camera_distance etc. são propriedades
+        # que leem e escrevem neste bloco
+        self._state = np.zeros(_STATE_SIZE, dtype=np.float32)
+        
+        # Transformações do objeto (os setters marcam _model_dirty)
+        self._model_dirty = True
         self.rotation_x = 30
         self.rotation_y = 45
         self.rotation_z = 0
@@ -73,26 +467,149 @@ class OpenGLWidget(QOpenGLWidget):
         self.translation_y = 0
         self.translation_z = 0
         
-        # Configurações de câmera
+        # Configurações de câmera (os setters marcam _cam_dirty)
+        self._cam_dirty = True
+        self._cam_pos = (0.0, 0.0, 0.0)
         self.camera_distance = 8.0
         self.camera_angle_x = 0
         self.camera_angle_y = 0
         
         # Configurações de iluminação
         self.shading_model = 'gouraud'  # flat, gouraud, phong
-        self.light_pos = [3.0, 3.0, 3.0, 1.0]
+        # light_pos é uma view do bloco de estado: glLightfv lê direto dele
+        self.light_pos = self._state[_STATE_LIGHT]
+        self.light_pos[:] = (3.0, 3.0, 3.0, 1.0)
+        self._light_dirty = True  # GL_POSITION precisa ser reenviado
         self.object_type = 'cube'  # cube, pyramid, cone, sphere
         self.projection_type = 'perspective'  # perspective, orthographic
         self.comparison_mode = False  # Modo de comparação lado a lado
-        
-        # Timer para animação
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update)
+        self._viewport_size = (1, 1)  # Atualizado em resizeGL
+        
+        # Legendas do modo comparação (fonte, cores e textos criados uma vez).
+        # QStaticText guarda o layout do texto já calculado e o fundo
+        # arredondado é desenhado uma vez num QPixmap (ver _label_background)
+        self._label_font = QFont("Arial", 12, QFont.Weight.Bold)
+        self._label_bg = QColor(20, 20, 30, 200)
+        self._label_bg_pixmap = None
+        self._label_data = tuple(
+            (self._make_static_label(text), color) for text, color in (
+                ('FLAT SHADING', QColor(230, 80, 80)),
+                ('GOURAUD SHADING', QColor(80, 230, 80)),
+                ('PHONG SHADING', QColor(80, 80, 230)),
+            )
+        )
+        
+        # Só redesenha quando algum estado mudou desde o último frame
+        self.needs_redraw = True
+        
+        # Animação guiada por frameSwapped (ver MainWindow.toggle_animation)
         self.animate = False
         
         # Mouse interaction
         self.last_pos = None
         
+        # Repaints de câmera e sliders agrupados em no máximo um por ~16 ms (60 Hz),
+        # independente da taxa de eventos do mouse e de valueChanged
+        self._pending_update = False
+        self._repaint_timer = QTimer()
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self._flush_pending_update)
+    
+    rotation_x = _state_field('rot_x', "float: Rotação do objeto no eixo X (em graus).",
+                              dirty_flag='_model_dirty')
+    rotation_y = _state_field('rot_y', "float: Rotação do objeto no eixo Y (em graus).",
+                              dirty_flag='_model_dirty')
+    rotation_z = _state_field('rot_z', "float: Rotação do objeto no eixo Z (em graus).",
+                              dirty_flag='_model_dirty')
+    scale_factor = _state_field('scale', "float: Fator de escala do objeto.",
+                                dirty_flag='_model_dirty')
+    translation_x = _state_field('trans_x', "float: Translação no eixo X.",
+                                 dirty_flag='_model_dirty')
+    translation_y = _state_field('trans_y', "float: Translação no eixo Y.",
+                                 dirty_flag='_model_dirty')
+    translation_z = _state_field('trans_z', "float: Translação no eixo Z.",
+                                 dirty_flag='_model_dirty')
+    camera_distance = _state_field('cam_dist', "float: Distância da câmera até a origem.",
+                                   dirty_flag='_cam_dirty')
+    camera_angle_x = _state_field('cam_angle_x', "float: Ângulo vertical da câmera (em graus).",
+                                  dirty_flag='_cam_dirty')
+    camera_angle_y = _state_field('cam_angle_y', "float: Ângulo horizontal da câmera (em graus).",
+                                  dirty_flag='_cam_dirty')
+    
+    def _update_camera_position(self):
+        """
+        Recalcula a posição da câmera (coordenadas esféricas -> cartesianas).
+        
+        Só é executado quando algum parâmetro da câmera mudou; cada ângulo é
+        convertido uma vez e seu seno/cosseno é compartilhado entre os eixos.
+        A matriz de visualização (look-at) é montada aqui e reutilizada
+        pelos frames seguintes.
+        """
+        d, ax, ay = self._state[_STATE_CAMERA].astype(np.float64)
+        ax, ay = math.radians(ax), math.radians(ay)
+        cos_ax, sin_ax = math.cos(ax), math.sin(ax)
+        cos_ay, sin_ay = math.cos(ay), math.sin(ay)
+        self._cam_pos = (d * sin_ay * cos_ax, d * sin_ax, d * cos_ay * cos_ax)
+        
+        # Olhando para a origem com Y para cima; transposta para column-major
+        self._view_matrix = np.ascontiguousarray(
+            _look_at(self._cam_pos, (0, 0, 0), (0, 1, 0)).T)
+        self._cam_dirty = False
+    
+    def _rebuild_model(self):
+        """
+        Recalcula as matrizes do objeto a partir de rotação, escala e translação.
+        
+        Só é executado quando algum desses parâmetros mudou. Guarda a matriz
+        T @ Rx @ Ry @ Rz @ S do modo normal e a matriz de rotação e escala
+        (reduzida a 0.8) do modo comparação, ambas em column-major.
+        """
+        self._comparison_model_matrix = self._rotation_scale_matrix(self.scale_factor * 0.8)
+        
+        model = self._rotation_scale_matrix(self.scale_factor)
+        # Em column-major a translação fica na última linha
+        model[3, :3] = self._state[_STATE_TRANSLATION]
+        self._model_matrix = model
+        self._model_dirty = False
+    
+    def set_light_component(self, index, value):
+        """
+        Altera (in-place) uma coordenada da posição da luz e marca o GL_POSITION como sujo.
+        
+        Args:
+            index (int): Coordenada a alterar (0 = X, 1 = Y, 2 = Z)
+            value (float): Novo valor da coordenada
+        """
+        self.light_pos[index] = value
+        self._light_dirty = True
+        self.needs_redraw = True
+    
+    def request_update(self):
+        """
+        Agenda um repaint para o próximo tick do timer de 16 ms.
+        
+        Várias chamadas dentro do mesmo intervalo (eventos de mouse, sliders)
+        resultam em um único paintGL.
+        """
+        self._pending_update = True
+        self.needs_redraw = True
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+    
+    def _flush_pending_update(self):
+        """Emite o repaint pendente; para o timer quando não há mais nada a fazer."""
+        if self._pending_update:
+            self._pending_update = False
+            self.redraw_if_needed()
+        else:
+            self._repaint_timer.stop()
+    
+    def redraw_if_needed(self):
+        """Pede um repaint ao Qt somente se needs_redraw estiver marcado."""
+        if self.needs_redraw:
+            self.needs_redraw = False
+            self.update()
+    
     def initializeGL(self):
         """
         Inicializa o contexto OpenGL e configura o estado inicial.
@@ -103,6 +620,7 @@ class OpenGLWidget(QOpenGLWidget):
         - Sistema de iluminação (luz ambiente, difusa, especular)
         - Propriedades do material (reflexão, brilho)
         - Normalização automática de vetores normais
+        - Descarte de faces traseiras (backface culling)
         
         Este método é chamado automaticamente pelo Qt uma vez antes da primeira renderização.
         """
@@ -114,18 +632,202 @@ class OpenGLWidget(QOpenGLWidget):
         glColorMaterial(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE)
         glEnable(GL_NORMALIZE)
         
+        # Todas as malhas são fechadas e com faces CCW vistas de fora:
+        # as faces de trás são descartadas antes da rasterização
+        glEnable(GL_CULL_FACE)
+        glCullFace(GL_BACK)
+        glFrontFace(GL_CCW)
+        
         # Configuração da luz
         glLightfv(GL_LIGHT0, GL_POSITION, self.light_pos)
-        glLightfv(GL_LIGHT0, GL_AMBIENT, [0.3, 0.3, 0.3, 1.0])
-        glLightfv(GL_LIGHT0, GL_DIFFUSE, [0.8, 0.8, 0.8, 1.0])
-        glLightfv(GL_LIGHT0, GL_SPECULAR, [1.0, 1.0, 1.0, 1.0])
+        glLightfv(GL_LIGHT0, GL_AMBIENT, _LIGHT_AMBIENT)
+        glLightfv(GL_LIGHT0, GL_DIFFUSE, _LIGHT_DIFFUSE)
+        glLightfv(GL_LIGHT0, GL_SPECULAR, _LIGHT_SPECULAR)
         
         # Propriedades do material
-        glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, [0.2, 0.2, 0.2, 1.0])
-        glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, [0.8, 0.8, 0.8, 1.0])
-        glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, [1.0, 1.0, 1.0, 1.0])
+        glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, _MATERIAL_AMBIENT)
+        glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, _MATERIAL_DIFFUSE)
+        glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, _MATERIAL_SPECULAR)
         glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, 50.0)
         
+        # Geometria estática enviada uma única vez para a GPU
+        self._build_static_geometry()
+        
+        # Programas GLSL dos três modelos de iluminação
+        self._build_shading_programs()
+    
+    def _build_shading_programs(self):
+        """
+        Compila e linka um programa GLSL por modelo de iluminação.
+        
+        Os programas ficam em self._programs ('flat', 'gouraud', 'phong').
+        Em caso de falha (driver sem GLSL 1.20, por exemplo) o dicionário
+        fica vazio e a renderização volta ao pipeline fixo, onde Phong é
+        aproximado por Gouraud.
+        """
+        self._programs = {}
+        try:
+            for shading, mode in _SHADING_MODES.items():
+                self._programs[shading] = shaders.compileProgram(
+                    shaders.compileShader(_shader_source(SHADING_VERTEX_SHADER, mode),
+                                          GL_VERTEX_SHADER),
+                    shaders.compileShader(_shader_source(SHADING_FRAGMENT_SHADER, mode),
+                                          GL_FRAGMENT_SHADER)
+                )
+        except Exception as e:
+            print(f"✗ Erro ao compilar shaders de iluminação: {e}")
+            self._programs = {}
+    
+    def _begin_shading(self, shading):
+        """
+        Ativa o modelo de iluminação para os próximos desenhos.
+        
+        Args:
+            shading (str): 'flat', 'gouraud' ou 'phong'
+        """
+        glShadeModel(GL_FLAT if shading == 'flat' else GL_SMOOTH)
+        if self._programs:
+            glUseProgram(self._programs[shading])
+    
+    def _end_shading(self):
+        """Volta ao pipeline fixo (grade, eixos e marcador da luz)."""
+        if self._programs:
+            glUseProgram(0)
+        
+    def _build_static_geometry(self):
+        """
+        Envia toda a geometria estática da cena para VBOs em layout SoA.
+        
+        Todos os objetos são concatenados em três fluxos independentes
+        (posições, normais e cores), cada um em seu próprio VBO e quantizado
+        (int16, int16 e uint8; ver _POSITION_SCALE); as malhas curvas também
+        usam um buffer de índices uint16 compartilhado. Cada objeto é selecionado por um intervalo
+        (offset, count, mode, indexed) em self._draw_ranges e desenhado com
+        um único glDrawArrays ou glDrawElements.
+        
+        - Cubo: 6 faces -> 12 triângulos (36 vértices)
+        - Pirâmide: 4 faces laterais + base em 2 triângulos (18 vértices)
+        - Grade: 22 linhas no plano XZ (44 vértices, cinza)
+        - Eixos: 3 linhas coloridas X/Y/Z (6 vértices)
+        - Cone: cilindro raio 1, altura 2, 32 subdivisões, com tampas (indexado)
+        - Esfera: raio 1.2, 32 x 32 subdivisões (indexada)
+        - Marcador da luz: esfera raio 0.15, 10 x 10 subdivisões (indexada)
+        """
+        positions, normals, colors, elements = [], [], [], []
+        self._draw_ranges = {}
+        
+        def add(name, mode, pos, nrm=None, col=None, indices=None):
+            pos = np.asarray(pos, dtype=np.float32).reshape(-1, 3)
+            offset = sum(len(p) for p in positions)
+            positions.append(pos)
+            normals.append(np.zeros_like(pos) if nrm is None
+                           else np.asarray(nrm, dtype=np.float32).reshape(-1, 3))
+            colors.append(np.zeros_like(pos) if col is None
+                          else np.asarray(col, dtype=np.float32).reshape(-1, 3))
+            if indices is None:
+                self._draw_ranges[name] = (offset, len(pos), mode, False)
+            else:
+                first = sum(len(e) for e in elements)
+                elements.append(np.asarray(indices, dtype=np.uint32) + offset)
+                self._draw_ranges[name] = (first, len(indices), mode, True)
+        
+        # --- Cubo ---
+        quad_split = list(_QUAD_SPLIT)
+        cube_idx = np.array(_CUBE_FACES)[:, quad_split]
+        add('cube', GL_TRIANGLES,
+            np.array(_CUBE_VERTS)[cube_idx],
+            np.repeat(_CUBE_NORMALS, 6, axis=0))
+        
+        # --- Pirâmide ---
+        add('pyramid', GL_TRIANGLES, *_pyramid_triangles())
+        
+        # --- Grade ---
+        # Para cada i em [-size, size]: uma linha paralela ao eixo X em z=i
+        # e uma paralela ao eixo Z em x=i, montadas de uma vez com NumPy
+        size = 5
+        i = np.arange(-size, size + 1, dtype=np.float32)
+        zeros = np.zeros_like(i)
+        edge = np.full_like(i, size)
+        grid = np.stack([
+            np.column_stack([-edge, zeros, i]), np.column_stack([edge, zeros, i]),   # Paralela ao eixo X
+            np.column_stack([i, zeros, -edge]), np.column_stack([i, zeros, edge]),   # Paralela ao eixo Z
+        ], axis=1).reshape(-1, 3)
+        add('grid', GL_LINES, grid, col=np.tile([0.3, 0.3, 0.3], (len(grid), 1)))
+        
+        # --- Eixos (X vermelho, Y verde, Z azul) ---
+        add('axes', GL_LINES, _AXES_VERTS, col=np.repeat(np.identity(3), 2, axis=0))
+        
+        # --- Cone (cilindro deslocado para ficar centrado em y=0) ---
+        cone_pos, cone_nrm, cone_idx = _make_cylinder(1.0, 2.0, 32, 32)
+        cone_pos[:, 1] -= 1.0
+        add('cone', GL_TRIANGLES, cone_pos, cone_nrm, indices=cone_idx)
+        
+        # --- Esfera e marcador da fonte de luz ---
+        sphere_pos, sphere_nrm, sphere_idx = _make_sphere(1.2, 32, 32)
+        add('sphere', GL_TRIANGLES, sphere_pos, sphere_nrm, indices=sphere_idx)
+        marker_pos, marker_nrm, marker_idx = _make_sphere(0.15, 10, 10)
+        add('light_marker', GL_TRIANGLES, marker_pos, marker_nrm, indices=marker_idx)
+        
+        # Buffers via OpenGL.arrays.vbo.VBO; o bind/unbind aqui força o
+        # envio (glBufferData) enquanto o contexto do Qt está ativo, uma
+        # única vez. Nos frames seguintes bind() só reassocia o buffer.
+        def upload(stream, scale, dtype, target='GL_ARRAY_BUFFER'):
+            data = np.round(np.concatenate(stream) * scale)
+            buffer = vbo.VBO(np.ascontiguousarray(data, dtype=dtype),
+                             usage='GL_STATIC_DRAW', target=target)
+            buffer.bind()
+            buffer.unbind()
+            return buffer
+        
+        # Menos de 65536 vértices no total: índices cabem em uint16
+        self._vbo_positions = upload(positions, 1.0 / _POSITION_SCALE, np.int16)
+        self._vbo_normals = upload(normals, _NORMAL_SCALE, np.int16)
+        self._vbo_colors = upload(colors, _COLOR_SCALE, np.uint8)
+        self._ibo = upload(elements, 1, np.uint16, target='GL_ELEMENT_ARRAY_BUFFER')
+        
+    def _draw_static(self, name, use_colors=False):
+        """
+        Desenha um objeto da geometria estática a partir dos VBOs SoA.
+        
+        Args:
+            name (str): Chave em self._draw_ranges ('cube', 'pyramid', 'cone', ...)
+            use_colors (bool): Se True, usa o fluxo de cores por vértice;
+                caso contrário, usa a cor corrente (glColor)
+        """
+        offset, count, mode, indexed = self._draw_ranges[name]
+        
+        # Posições inteiras: a escala de volta para unidades do mundo fica
+        # na modelview (normais e cores inteiras o OpenGL já normaliza)
+        glPushMatrix()
+        glScalef(_POSITION_SCALE, _POSITION_SCALE, _POSITION_SCALE)
+        
+        glEnableClientState(GL_VERTEX_ARRAY)
+        self._vbo_positions.bind()
+        glVertexPointer(3, GL_SHORT, 0, ctypes.c_void_p(0))
+        
+        glEnableClientState(GL_NORMAL_ARRAY)
+        self._vbo_normals.bind()
+        glNormalPointer(GL_SHORT, 0, ctypes.c_void_p(0))
+        
+        if use_colors:
+            glEnableClientState(GL_COLOR_ARRAY)
+            self._vbo_colors.bind()
+            glColorPointer(3, GL_UNSIGNED_BYTE, 0, ctypes.c_void_p(0))
+        
+        if indexed:
+            self._ibo.bind()
+            glDrawElements(mode, count, GL_UNSIGNED_SHORT, ctypes.c_void_p(offset * 2))
+            self._ibo.unbind()
+        else:
+            glDrawArrays(mode, offset, count)
+        
+        if use_colors:
+            glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        self._vbo_positions.unbind()
+        glPopMatrix()
+        
     def resizeGL(self, w, h):
         """
         Ajusta a viewport e a projeção quando a janela é redimensionada.
@@ -141,17 +843,30 @@ class OpenGLWidget(QOpenGLWidget):
         """
         if h == 0:
             h = 1
-        glViewport(0, 0, w, h)
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
+        self._viewport_size = (w, h)
+        self._apply_viewport(0, w, h)
+    
+    def _apply_viewport(self, x, w, h):
+        """
+        Define uma viewport e a projeção com o aspect ratio dela.
+        
+        Args:
+            x (int): Início horizontal da viewport em pixels
+            w (int): Largura da viewport em pixels
+            h (int): Altura da viewport em pixels
+        """
+        glViewport(x, 0, w, h)
         
         aspect = w / h
         if self.projection_type == 'perspective':
-            gluPerspective(45.0, aspect, 0.1, 100.0)
+            projection = _perspective(45.0, aspect, 0.1, 100.0)
         else:
             size = 4.0
-            glOrtho(-size*aspect, size*aspect, -size, size, 0.1, 100.0)
-            
+            projection = _orthographic(-size*aspect, size*aspect, -size, size, 0.1, 100.0)
+        
+        # NumPy é row-major; o OpenGL espera column-major
+        glMatrixMode(GL_PROJECTION)
+        glLoadMatrixf(projection.T)
         glMatrixMode(GL_MODELVIEW)
         
     def paintGL(self):
@@ -172,61 +887,54 @@ class OpenGLWidget(QOpenGLWidget):
         Este método é chamado automaticamente pelo Qt sempre que a cena precisa ser redesenhada.
         """
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        glLoadIdentity()
-        
-        # Posicionar câmera
-        cam_x = self.camera_distance * math.sin(math.radians(self.camera_angle_y)) * math.cos(math.radians(self.camera_angle_x))
-        cam_y = self.camera_distance * math.sin(math.radians(self.camera_angle_x))
-        cam_z = self.camera_distance * math.cos(math.radians(self.camera_angle_y)) * math.cos(math.radians(self.camera_angle_x))
         
-        gluLookAt(cam_x, cam_y, cam_z,  # Posição da câmera
-                  0, 0, 0,               # Olhando para origem
-                  0, 1, 0)               # Vetor up
-        
-        # Atualizar posição da luz no espaço mundial
-        glLightfv(GL_LIGHT0, GL_POSITION, self.light_pos)
+        # Posicionar câmera (posição e matriz recalculadas apenas quando mudou)
+        view_changed = self._cam_dirty
+        if view_changed:
+            self._update_camera_position()
+        glLoadMatrixf(self._view_matrix)
+        if self._model_dirty:
+            self._rebuild_model()
+        
+        # Atualizar posição da luz no espaço mundial. O OpenGL guarda o
+        # GL_POSITION já transformado pela modelview, então só é preciso
+        # reenviá-lo quando a luz ou a câmera mudam.
+        if self._light_dirty or view_changed:
+            glLightfv(GL_LIGHT0, GL_POSITION, self.light_pos)
+            self._light_dirty = False
+        
+        # Passo sem iluminação: grade, eixos e fonte de luz juntos, com um
+        # único par glDisable/glEnable(GL_LIGHTING) por frame
+        glDisable(GL_LIGHTING)
+        if self.comparison_mode:
+            for i in range(3):
+                self._apply_comparison_viewport(i)
+                self.draw_light_marker()
+        else:
+            self.draw_grid()
+            self.draw_axes()
+            self.draw_light_marker()
+        glEnable(GL_LIGHTING)
         
         if self.comparison_mode:
-            # Modo comparação: desenhar 3 objetos lado a lado
+            # Modo comparação: um objeto por terço da janela
             self.draw_comparison_view()
         else:
             # Modo normal: desenhar um objeto
-            # Desenhar grade de referência
-            self.draw_grid()
-            
-            # Desenhar eixos de coordenadas
-            self.draw_axes()
-            
             # Aplicar transformações ao objeto
+            # (matriz recalculada apenas quando mudou)
             glPushMatrix()
-            glTranslatef(self.translation_x, self.translation_y, self.translation_z)
-            glRotatef(self.rotation_x, 1, 0, 0)
-            glRotatef(self.rotation_y, 0, 1, 0)
-            glRotatef(self.rotation_z, 0, 0, 1)
-            glScalef(self.scale_factor, self.scale_factor, self.scale_factor)
+            glMultMatrixf(self._model_matrix)
             
             # Configurar modelo de sombreamento
-            if self.shading_model == 'flat':
-                glShadeModel(GL_FLAT)
-            else:
-                glShadeModel(GL_SMOOTH)
+            self._begin_shading(self.shading_model)
                 
             # Desenhar objeto
             glColor3f(0.3, 0.7, 0.9)
             self.draw_current_object()
+            self._end_shading()
                 
             glPopMatrix()
-        
-        # Desenhar fonte de luz
-        glDisable(GL_LIGHTING)
-        glColor3f(1.0, 1.0, 0.0)
-        glPushMatrix()
-        glTranslatef(self.light_pos[0], self.light_pos[1], self.light_pos[2])
-        quadric = gluNewQuadric()
-        gluSphere(quadric, 0.15, 10, 10)
-        gluDeleteQuadric(quadric)
-        glPopMatrix()
-        glEnable(GL_LIGHTING)
     
     def paintEvent(self, event):
         """
@@ -251,20 +959,9 @@ class OpenGLWidget(QOpenGLWidget):
         A grade consiste em linhas paralelas aos eixos X e Z,
         criando uma malha quadriculada de 10x10 unidades.
         Útil para ter noção de escala e posição dos objetos no espaço.
+        Chamado pelo passo sem iluminação de paintGL.
         """
-        glDisable(GL_LIGHTING)
-        glColor3f(0.3, 0.3, 0.3)
-        glBegin(GL_LINES)
-        size = 5
-        for i in range(-size, size + 1):
-            # Linhas paralelas ao eixo X
-            glVertex3f(-size, 0, i)
-            glVertex3f(size, 0, i)
-            # Linhas paralelas ao eixo Z
-            glVertex3f(i, 0, -size)
-            glVertex3f(i, 0, size)
-        glEnd()
-        glEnable(GL_LIGHTING)
+        self._draw_static('grid', use_colors=True)
         
     def draw_axes(self):
         """
@@ -276,63 +973,32 @@ class OpenGLWidget(QOpenGLWidget):
         - Azul: Eixo Z (profundidade, frente-trás)
         
         Cada eixo tem 2 unidades de comprimento a partir da origem.
+        Chamado pelo passo sem iluminação de paintGL.
         """
-        glDisable(GL_LIGHTING)
         glLineWidth(3)
-        glBegin(GL_LINES)
-        # Eixo X (vermelho)
-        glColor3f(1, 0, 0)
-        glVertex3f(0, 0, 0)
-        glVertex3f(2, 0, 0)
-        # Eixo Y (verde)
-        glColor3f(0, 1, 0)
-        glVertex3f(0, 0, 0)
-        glVertex3f(0, 2, 0)
-        # Eixo Z (azul)
-        glColor3f(0, 0, 1)
-        glVertex3f(0, 0, 0)
-        glVertex3f(0, 0, 2)
-        glEnd()
+        self._draw_static('axes', use_colors=True)
         glLineWidth(1)
-        glEnable(GL_LIGHTING)
+    
+    def draw_light_marker(self):
+        """
+        Desenha uma pequena esfera amarela na posição da fonte de luz.
+        
+        Chamado pelo passo sem iluminação de paintGL.
+        """
+        glColor3f(1.0, 1.0, 0.0)
+        glPushMatrix()
+        glTranslatef(self.light_pos[0], self.light_pos[1], self.light_pos[2])
+        self._draw_static('light_marker')
+        glPopMatrix()
         
     def draw_cube(self):
         """
         Desenha um cubo centrado na origem com lado de 2 unidades.
         
-        O cubo é definido por 8 vértices e 6 faces quadriláteras.
-        Cada face tem sua normal corretamente definida para iluminação.
-        Usa coordenadas de vértices hardcoded e arrays para faces e normais.
-        """
-        vertices = [
-            [-1, -1, -1], [1, -1, -1], [1, 1, -1], [-1, 1, -1],  # Traseira
-            [-1, -1, 1], [1, -1, 1], [1, 1, 1], [-1, 1, 1]       # Frontal
-        ]
-        
-        faces = [
-            [0, 1, 2, 3],  # Traseira
-            [4, 5, 6, 7],  # Frontal
-            [0, 1, 5, 4],  # Inferior
-            [2, 3, 7, 6],  # Superior
-            [0, 3, 7, 4],  # Esquerda
-            [1, 2, 6, 5]   # Direita
-        ]
-        
-        normals = [
-            [0, 0, -1],   # Traseira
-            [0, 0, 1],    # Frontal
-            [0, -1, 0],   # Inferior
-            [0, 1, 0],    # Superior
-            [-1, 0, 0],   # Esquerda
-            [1, 0, 0]     # Direita
-        ]
-        
-        glBegin(GL_QUADS)
-        for i, face in enumerate(faces):
-            glNormal3fv(normals[i])
-            for vertex_idx in face:
-                glVertex3fv(vertices[vertex_idx])
-        glEnd()
+        A geometria (36 vértices com normais por face) está nos VBOs
+        estáticos criados em initializeGL; um único glDrawArrays.
+        """
+        self._draw_static('cube')
         
     def draw_pyramid(self):
         """
@@ -342,97 +1008,28 @@ class OpenGLWidget(QOpenGLWidget):
         - Vértice superior (apex) em y=1.5
         - Base quadrada em y=-0.5 com lado de 2 unidades
         - 4 faces triangulares laterais
-        - 1 face quadrada na base
-        
-        As normais são calculadas dinamicamente usando produto vetorial
-        para garantir iluminação correta em todas as faces.
-        """
-        apex = [0, 1.5, 0]
-        base = [
-            [-1, -0.5, 1],
-            [1, -0.5, 1],
-            [1, -0.5, -1],
-            [-1, -0.5, -1]
-        ]
-        
-        # Função para calcular normal
-        def calc_normal(p1, p2, p3):
-            v1 = [p2[i] - p1[i] for i in range(3)]
-            v2 = [p3[i] - p1[i] for i in range(3)]
-            normal = [
-                v1[1]*v2[2] - v1[2]*v2[1],
-                v1[2]*v2[0] - v1[0]*v2[2],
-                v1[0]*v2[1] - v1[1]*v2[0]
-            ]
-            length = math.sqrt(sum(n*n for n in normal))
-            return [n/length for n in normal]
-        
-        # Faces laterais
-        glBegin(GL_TRIANGLES)
-        for i in range(4):
-            next_i = (i + 1) % 4
-            normal = calc_normal(apex, base[i], base[next_i])
-            glNormal3fv(normal)
-            glVertex3fv(apex)
-            glVertex3fv(base[i])
-            glVertex3fv(base[next_i])
-        glEnd()
-        
-        # Base
-        glBegin(GL_QUADS)
-        glNormal3f(0, -1, 0)
-        for vertex in reversed(base):
-            glVertex3fv(vertex)
-        glEnd()
+        - 1 face quadrada na base (enviada como 2 triângulos)
         
-    def draw_cone(self):
+        Vértices e normais vêm de _pyramid_triangles (NumPy) e
+        estão nos VBOs estáticos; um único glDrawArrays.
         """
-        Desenha um cone usando primitivas GLU (OpenGL Utility Library).
-        
-        O cone consiste em:
-        - Corpo cilíndrico: raio 1, altura 2, 32 subdivisões
-        - Tampa inferior: disco com raio 1
-        - Tampa superior: disco com raio 1
+        self._draw_static('pyramid')
         
-        Usa gluQuadric para gerar automaticamente as normais suaves (GLU_SMOOTH),
-        resultando em melhor iluminação nos modelos Gouraud e Phong.
+    def draw_cone(self):
         """
-        quadric = gluNewQuadric()
-        gluQuadricNormals(quadric, GLU_SMOOTH)
-        gluQuadricDrawStyle(quadric, GLU_FILL)
-        
-        glPushMatrix()
-        glTranslatef(0, -1, 0)
-        
-        # Corpo do cone
-        gluCone(quadric, 1.0, 1.0, 2.0, 32, 32)
+        Desenha o cone (corpo cilíndrico + tampas) pré-tesselado.
         
-        # Tampa inferior
-        glPushMatrix()
-        glRotatef(180, 1, 0, 0)
-        gluDisk(quadric, 0, 1.0, 32, 1)
-        glPopMatrix()
-        
-        # Tampa superior
-        glPushMatrix()
-        glTranslatef(0, 0, 2.0)
-        gluDisk(quadric, 0, 1.0, 32, 1)
-        glPopMatrix()
-        
-        glPopMatrix()
-        gluDeleteQuadric(quadric)
+        A malha indexada está nos VBOs estáticos; um único glDrawElements.
+        """
+        self._draw_static('cone')
         
     def draw_sphere(self):
         """
-        Desenha uma esfera usando primitivas GLU.
+        Desenha a esfera de raio 1.2 pré-tesselada.
         
-        Esfera com raio de 1.2 unidades e 32 subdivisões em latitude e longitude.
-        As normais são geradas automaticamente (GLU_SMOOTH) para iluminação suave.
+        A malha indexada está nos VBOs estáticos; um único glDrawElements.
         """
-        quadric = gluNewQuadric()
-        gluQuadricNormals(quadric, GLU_SMOOTH)
-        gluSphere(quadric, 1.2, 32, 32)
-        gluDeleteQuadric(quadric)
+        self._draw_static('sphere')
         
     def draw_current_object(self):
         """
@@ -453,46 +1050,89 @@ class OpenGLWidget(QOpenGLWidget):
         elif self.object_type == 'sphere':
             self.draw_sphere()
     
+    def _apply_comparison_viewport(self, i):
+        """
+        Ativa o terço i da janela (0 = esquerda, 1 = centro, 2 = direita).
+        
+        Args:
+            i (int): Índice da viewport
+        """
+        w, h = self._viewport_size
+        third = w // 3
+        self._apply_viewport(i * third, third, h)
+    
     def draw_comparison_view(self):
         """
-        Desenha três objetos lado a lado para comparar modelos de iluminação.
+        Desenha o objeto atual em três viewports para comparar modelos de iluminação.
         
-        Posiciona três instâncias do objeto atual em uma linha horizontal,
-        cada uma com um modelo de iluminação diferente:
+        A janela é dividida em três terços com glViewport, cada um com a
+        projeção no seu próprio aspect ratio e o objeto na origem:
         - Esquerda: Flat Shading (vermelho)
         - Centro: Gouraud Shading (verde)
         - Direita: Phong Shading (azul)
         
-        Os objetos são levemente reduzidos (80% do tamanho normal) para caber
-        melhor na tela. Cores diferentes ajudam a diferenciar visualmente.
+        A matriz do objeto (80% do tamanho normal) e a câmera são as mesmas
+        nas três viewports; entre elas mudam apenas a viewport, o programa
+        GLSL e a cor. Ao final a viewport da janela inteira é restaurada.
         """
-        spacing = 3.5
-        positions = [-spacing, 0, spacing]
-        shading_models = ['flat', 'gouraud', 'phong']
+        instances = (
+            ('flat', (0.9, 0.3, 0.3)),
+            ('gouraud', (0.3, 0.9, 0.3)),
+            ('phong', (0.3, 0.3, 0.9)),
+        )
         
-        for i, (pos_x, shading) in enumerate(zip(positions, shading_models)):
-            glPushMatrix()
-            
-            # Posicionar objeto
-            glTranslatef(pos_x, 0, 0)
-            glRotatef(self.rotation_x, 1, 0, 0)
-            glRotatef(self.rotation_y, 0, 1, 0)
-            glRotatef(self.rotation_z, 0, 0, 1)
-            glScalef(self.scale_factor * 0.8, self.scale_factor * 0.8, self.scale_factor * 0.8)
+        # Rotação e escala são iguais para as três viewports: a matriz
+        # (mantida por _rebuild_model) é aplicada uma única vez sobre a view
+        glPushMatrix()
+        glMultMatrixf(self._comparison_model_matrix)
+        
+        # Viewports já ordenadas por modelo: glShadeModel muda só de
+        # flat para smooth; cada modelo ativa o seu programa GLSL
+        current_shade = None
+        for i, (shading, color) in enumerate(instances):
+            self._apply_comparison_viewport(i)
             
-            # Configurar modelo de sombreamento
-            if shading == 'flat':
-                glShadeModel(GL_FLAT)
-            else:
-                glShadeModel(GL_SMOOTH)
+            shade = GL_FLAT if shading == 'flat' else GL_SMOOTH
+            if shade != current_shade:
+                glShadeModel(shade)
+                current_shade = shade
+            if self._programs:
+                glUseProgram(self._programs[shading])
             
             # Desenhar objeto com cor variada para diferenciação
-            colors = [(0.9, 0.3, 0.3), (0.3, 0.9, 0.3), (0.3, 0.3, 0.9)]
-            glColor3f(*colors[i])
-            
+            glColor3f(*color)
             self.draw_current_object()
+        
+        self._end_shading()
+        glPopMatrix()
+        
+        w, h = self._viewport_size
+        self._apply_viewport(0, w, h)
+    
+    def _rotation_scale_matrix(self, scale):
+        """
+        Monta Rx @ Ry @ Rz @ S em NumPy, equivalente à sequência
+        glRotatef(x), glRotatef(y), glRotatef(z), glScalef(scale).
+        
+        Args:
+            scale (float): Fator de escala uniforme
             
-            glPopMatrix()
+        Returns:
+            np.ndarray: Matriz 4x4 float32 em ordem column-major (pronta para glMultMatrixf)
+        """
+        ax, ay, az = np.radians(self._state[_STATE_ROTATION].astype(np.float64))
+        cx, sx = math.cos(ax), math.sin(ax)
+        cy, sy = math.cos(ay), math.sin(ay)
+        cz, sz = math.cos(az), math.sin(az)
+        
+        rx = np.array([[1, 0, 0], [0, cx, -sx], [0, sx, cx]])
+        ry = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]])
+        rz = np.array([[cz, -sz, 0], [sz, cz, 0], [0, 0, 1]])
+        
+        m = np.identity(4, dtype=np.float32)
+        m[:3, :3] = rx @ ry @ rz * scale
+        # NumPy é row-major; o OpenGL espera column-major
+        return np.ascontiguousarray(m.T)
     
     def draw_labels(self):
         """
@@ -507,33 +1147,73 @@ class OpenGLWidget(QOpenGLWidget):
         As cores das legendas correspondem às cores dos objetos:
         vermelho (Flat), verde (Gouraud), azul (Phong).
         """
+        background = self._label_background()
+        
         # Usar QPainter para desenhar texto sobre OpenGL
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Configurar fonte
-        font = QFont("Arial", 12, QFont.Weight.Bold)
-        painter.setFont(font)
+        # Configurar fonte (criada em __init__)
+        painter.setFont(self._label_font)
         
         # Desenhar legendas
-        labels = ['FLAT SHADING', 'GOURAUD SHADING', 'PHONG SHADING']
-        colors = [QColor(230, 80, 80), QColor(80, 230, 80), QColor(80, 80, 230)]
-        
-        for i, (label, color) in enumerate(zip(labels, colors)):
+        for i, (label, color) in enumerate(self._label_data):
             x_pos = int((i + 0.5) * self.width() / 3)
             y_pos = 40
             
-            # Desenhar fundo
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QColor(20, 20, 30, 200))
-            painter.drawRoundedRect(x_pos - 75, y_pos - 15, 150, 35, 5, 5)
+            # Desenhar fundo (pixmap pré-renderizado)
+            painter.drawPixmap(x_pos - 75, y_pos - 15, background)
             
-            # Desenhar texto
+            # Desenhar texto centralizado na caixa de 150 x 35
+            size = label.size()
             painter.setPen(color)
-            painter.drawText(x_pos - 70, y_pos - 15, 140, 35, 
-                           Qt.AlignmentFlag.AlignCenter, label)
+            painter.drawStaticText(int(x_pos - size.width() / 2),
+                                   int(y_pos - 15 + (35 - size.height()) / 2),
+                                   label)
         
         painter.end()
+    
+    def _make_static_label(self, text):
+        """
+        Cria um QStaticText com o layout já preparado para a fonte das legendas.
+        
+        Args:
+            text (str): Texto da legenda
+            
+        Returns:
+            QStaticText: Texto pronto para QPainter.drawStaticText
+        """
+        label = QStaticText(text)
+        label.setTextFormat(Qt.TextFormat.PlainText)
+        label.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+        label.prepare(QTransform(), self._label_font)
+        return label
+    
+    def _label_background(self):
+        """
+        Retorna o fundo arredondado das legendas, renderizado uma única vez.
+        
+        O pixmap é refeito apenas se a densidade de pixels da tela mudar.
+        
+        Returns:
+            QPixmap: Retângulo arredondado semi-transparente de 150 x 35
+        """
+        dpr = self.devicePixelRatioF()
+        pixmap = self._label_bg_pixmap
+        if pixmap is None or pixmap.devicePixelRatio() != dpr:
+            pixmap = QPixmap(int(150 * dpr), int(35 * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self._label_bg)
+            painter.drawRoundedRect(0, 0, 150, 35, 5, 5)
+            painter.end()
+            
+            self._label_bg_pixmap = pixmap
+        return pixmap
         
     def mousePressEvent(self, event):
         """
@@ -571,7 +1251,7 @@ class OpenGLWidget(QOpenGLWidget):
             self.camera_angle_x = max(-89, min(89, self.camera_angle_x))
             
             self.last_pos = event.position()
-            self.update()
+            self.request_update()
     
     def mouseReleaseEvent(self, event):
         """
@@ -601,7 +1281,7 @@ class OpenGLWidget(QOpenGLWidget):
         delta = event.angleDelta().y()
         self.camera_distance -= delta * 0.01
         self.camera_distance = max(2, min(20, self.camera_distance))
-        self.update()
+        self.request_update()
 
 class MainWindow(QMainWindow):
     """
@@ -692,7 +1372,7 @@ class MainWindow(QMainWindow):
         object_layout = QVBoxLayout()
         
         self.object_combo = QComboBox()
-        self.object_combo.addItems(['Cubo', 'Pirâmide', 'cone', 'Esfera'])
+        self.object_combo.addItems(['Cubo', 'Pirâmide', 'Cone', 'Esfera'])
         self.object_combo.currentTextChanged.connect(self.change_object)
         object_layout.addWidget(QLabel("Tipo:"))
         object_layout.addWidget(self.object_combo)
@@ -849,7 +1529,7 @@ class MainWindow(QMainWindow):
         Altera o tipo de objeto a ser renderizado.
         
         Args:
-            text (str): Nome do objeto em português ('Cubo', 'Pirâmide', 'cone', 'Esfera')
+            text (str): Nome do objeto em português ('Cubo', 'Pirâmide', 'Cone', 'Esfera')
             
         Converte o texto da interface para o identificador interno
         e atualiza o widget OpenGL.
@@ -869,7 +1549,7 @@ class MainWindow(QMainWindow):
         Atualiza o modelo de sombreamento usado na renderização.
         Flat = sombreamento uniforme por face
         Gouraud = interpolação de cores nos vértices
-        Phong = interpolação de normais (aproximado com GL_SMOOTH)
+        Phong = interpolação de normais e iluminação por fragmento (GLSL)
         """
         shade_map = {'Flat': 'flat', 'Gouraud': 'gouraud', 'Phong': 'phong'}
         self.gl_widget.shading_model = shade_map[text]
@@ -903,7 +1583,7 @@ class MainWindow(QMainWindow):
         """
         self.gl_widget.rotation_x = value
         self.rot_x_label.setText(f"X: {value}°")
-        self.gl_widget.update()
+        self.gl_widget.request_update()
     
     def update_rotation_y(self, value):
         """
@@ -914,7 +1594,7 @@ class MainWindow(QMainWindow):
         """
         self.gl_widget.rotation_y = value
         self.rot_y_label.setText(f"Y: {value}°")
-        self.gl_widget.update()
+        self.gl_widget.request_update()
     
     def update_rotation_z(self, value):
         """
@@ -925,7 +1605,7 @@ class MainWindow(QMainWindow):
         """
         self.gl_widget.rotation_z = value
         self.rot_z_label.setText(f"Z: {value}°")
-        self.gl_widget.update()
+        self.gl_widget.request_update()
     
     def update_scale(self, value):
         """
@@ -938,7 +1618,7 @@ class MainWindow(QMainWindow):
         """
         self.gl_widget.scale_factor = value / 100.0
         self.scale_label.setText(f"Escala: {value/100:.1f}x")
-        self.gl_widget.update()
+        self.gl_widget.request_update()
     
     def update_light_x(self, value):
         """
@@ -947,9 +1627,9 @@ class MainWindow(QMainWindow):
         Args:
             value (int): Valor do slider (-50 a 50), convertido para coordenada (-5.0 a 5.0)
         """
-        self.gl_widget.light_pos[0] = value / 10.0
+        self.gl_widget.set_light_component(0, value / 10.0)
         self.light_x_label.setText(f"X: {value/10:.1f}")
-        self.gl_widget.update()
+        self.gl_widget.request_update()
     
     def update_light_y(self, value):
         """
@@ -958,9 +1638,9 @@ class MainWindow(QMainWindow):
         Args:
             value (int): Valor do slider (-50 a 50), convertido para coordenada (-5.0 a 5.0)
         """
-        self.gl_widget.light_pos[1] = value / 10.0
+        self.gl_widget.set_light_component(1, value / 10.0)
         self.light_y_label.setText(f"Y: {value/10:.1f}")
-        self.gl_widget.update()
+        self.gl_widget.request_update()
     
     def update_light_z(self, value):
         """
@@ -969,16 +1649,18 @@ class MainWindow(QMainWindow):
         Args:
             value (int): Valor do slider (-50 a 50), convertido para coordenada (-5.0 a 5.0)
         """
-        self.gl_widget.light_pos[2] = value / 10.0
+        self.gl_widget.set_light_component(2, value / 10.0)
         self.light_z_label.setText(f"Z: {value/10:.1f}")
-        self.gl_widget.update()
+        self.gl_widget.request_update()
     
     def toggle_animation(self):
         """
         Alterna o estado da animação automática.
         
         Quando ativada, a animação rotaciona o objeto continuamente
-        no eixo Y a ~60 FPS (16ms por frame).
+        no eixo Y, um passo por frame exibido: o sinal frameSwapped do
+        widget dispara start_animation, que pede o próximo frame. O ritmo
+        fica preso ao VSync, sem timer de intervalo fixo.
         
         Estados:
         - Desligado: botão mostra "▶ Animar Rotação"
@@ -986,17 +1668,33 @@ class MainWindow(QMainWindow):
         """
         if self.gl_widget.animate:
             self.gl_widget.animate = False
-            self.gl_widget.timer.stop()
+            self.gl_widget.frameSwapped.disconnect(self.start_animation)
             self.animate_btn.setText("▶ Animar Rotação")
         else:
             self.gl_widget.animate = True
-            self.gl_widget.timer.start(16)  # ~60 FPS
+            self.gl_widget.frameSwapped.connect(self.start_animation)
+            self.gl_widget.update()  # Primeiro frame do laço
             self.animate_btn.setText("⏸ Parar Animação")
     
     def start_animation(self):
-        if self.gl_widget.animate:
-            self.gl_widget.rotation_y = (self.gl_widget.rotation_y + 2) % 360
-            self.rot_y_slider.setValue(int(self.gl_widget.rotation_y))
+        """
+        Avança a rotação em Y a cada frame exibido e pede o próximo.
+        
+        O slider e o rótulo são atualizados sem emitir valueChanged, para
+        que o frame seja pedido direto ao widget em vez de passar pelo timer
+        de request_update.
+        """
+        if not self.gl_widget.animate:
+            return
+        angle = int(self.gl_widget.rotation_y + 2) % 360
+        self.gl_widget.rotation_y = angle
+        
+        self.rot_y_slider.blockSignals(True)
+        self.rot_y_slider.setValue(angle)
+        self.rot_y_slider.blockSignals(False)
+        self.rot_y_label.setText(f"Y: {angle}°")
+        
+        self.gl_widget.redraw_if_needed()
     
     def reset_view(self):
         """
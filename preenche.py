@@ -6,16 +6,11 @@ from OpenGL.GLU import *
 from OpenGL.GLUT import *
 import numpy as np
 
-# Estrutura para representar uma aresta
-class Edge:
-    def __init__(self, y_min, y_max, x, slope_inv):
-        self.y_min = y_min
-        self.y_max = y_max
-        self.x = x  # x na y_min (valor atual de x)
-        self.slope_inv = slope_inv  # 1/m (inverso da inclinação)
-    
-    def __lt__(self, other):
-        return self.x < other.x
+# Numba é opcional: sem ele a varredura usa o laço vetorizado em NumPy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Variáveis globais
 current_polygon = []
@@ -25,87 +20,256 @@ line_thickness = 2
 fill_color = [0.0, 0.0, 1.0]  # Azul
 window_width, window_height = 800, 600
 
+# Se True, o preenchimento é feito pelo rasterizador da GPU (leque de
+# triângulos ou tesselador GLU) em vez do algoritmo de varredura em Python.
+# O padrão mantém o algoritmo de coerência de arestas, objeto do trabalho.
+use_gpu_fill = False
+_tess = None  # Tesselador GLU, criado na primeira utilização
+
+# Display list da interface e o estado (espessura, cor) com que foi gravada
+_interface_list = None
+_interface_key = None
+
 def create_et(points):
-    """Cria a Tabela de Lados (Edge Table)"""
-    et = []
-    n = len(points)
+    """Cria a Tabela de Lados (Edge Table)
+
+    A ET é uma estrutura de arrays (SoA): um array NumPy por campo,
+    todos com uma posição por aresta não horizontal, ordenados por y_min.
+
+    Campos:
+        y_min: y inicial da aresta
+        y_max: y final da aresta
+        x: x na y_min (valor inicial de x)
+        inv: 1/m (inverso da inclinação)
+    """
+    pts = np.asarray(points, dtype=float)
+    p1 = pts
+    p2 = np.roll(pts, -1, axis=0)
+    
+    # Garante que p1.y <= p2.y
+    swap = p1[:, 1] > p2[:, 1]
+    p1, p2 = np.where(swap[:, None], p2, p1), np.where(swap[:, None], p1, p2)
+    
+    # Ignora arestas horizontais
+    mask = p1[:, 1] != p2[:, 1]
+    p1, p2 = p1[mask], p2[mask]
+    
+    slope_inv = (p2[:, 0] - p1[:, 0]) / (p2[:, 1] - p1[:, 1])
+    
+    # Ordena a ET por y_min (estável, como list.sort)
+    order = np.argsort(p1[:, 1], kind='stable')
+    return {
+        'y_min': p1[order, 1],
+        'y_max': p2[order, 1],
+        'x': p1[order, 0],
+        'inv': slope_inv[order],
+    }
+
+def is_convex(points):
+    """Indica se o polígono é convexo e simples
+
+    Todas as curvas entre arestas consecutivas devem ter o mesmo sentido
+    e somar uma única volta (exclui polígonos estrelados).
+    """
+    pts = np.asarray(points, dtype=float)
+    d1 = np.roll(pts, -1, axis=0) - pts
+    d2 = np.roll(d1, -1, axis=0)
+    cross = d1[:, 0] * d2[:, 1] - d1[:, 1] * d2[:, 0]
+    dot = (d1 * d2).sum(axis=1)
+    turns = np.arctan2(cross, dot)
+    same_side = np.all(cross >= 0) or np.all(cross <= 0)
+    return bool(same_side and abs(abs(turns.sum()) - 2 * np.pi) < 1e-6)
+
+def get_tesselator():
+    """Cria (uma única vez) o tesselador GLU usado para polígonos côncavos"""
+    global _tess
+    if _tess is None:
+        _tess = gluNewTess()
+        gluTessCallback(_tess, GLU_TESS_BEGIN, glBegin)
+        gluTessCallback(_tess, GLU_TESS_VERTEX, glVertex3dv)
+        gluTessCallback(_tess, GLU_TESS_END, glEnd)
+        # Vértices criados em auto-interseções
+        gluTessCallback(_tess, GLU_TESS_COMBINE, lambda coords, data, weight: coords)
+        # Regra par-ímpar, a mesma do preenchimento por varredura
+        gluTessProperty(_tess, GLU_TESS_WINDING_RULE, GLU_TESS_WINDING_ODD)
+    return _tess
+
+def fill_polygon_gpu(points):
+    """Preenche o polígono com o rasterizador da GPU"""
+    glColor3f(fill_color[0], fill_color[1], fill_color[2])
+    
+    # Convexo: um leque de triângulos a partir do primeiro vértice
+    if is_convex(points):
+        glBegin(GL_TRIANGLE_FAN)
+        for p in points:
+            glVertex2i(p[0], p[1])
+        glEnd()
+        return
+    
+    # Côncavo (ou com auto-interseção): triangulado pelo tesselador GLU
+    tess = get_tesselator()
+    gluTessBeginPolygon(tess, None)
+    gluTessBeginContour(tess)
+    for p in points:
+        vertex = (float(p[0]), float(p[1]), 0.0)
+        gluTessVertex(tess, vertex, vertex)
+    gluTessEndContour(tess)
+    gluTessEndPolygon(tess)
+
+def _scanline_spans_numpy(et, y_min, y_max):
+    """Calcula os spans da varredura com a AET como array de índices NumPy
+
+    Returns:
+        np.ndarray: Spans (x_start, x_end, y) em int64, um por linha
+    """
+    et_y_min, et_y_max, et_inv = et['y_min'], et['y_max'], et['inv']
+    x = et['x'].copy()  # x atual de cada aresta
+    
+    # Inicializa a AET (array de índices de arestas da ET)
+    aet = np.empty(0, dtype=np.intp)
+    next_edge = 0
     
-    for i in range(n):
-        p1 = points[i]
-        p2 = points[(i + 1) % n]
+    spans = []
+    
+    # Para cada linha de varredura
+    for y in range(y_min, y_max + 1):
+        # Adiciona à AET as arestas que começam em y (a ET está ordenada,
+        # então elas formam um bloco contíguo a partir de next_edge)
+        end = np.searchsorted(et_y_min, y, side='right')
+        if end > next_edge:
+            aet = np.concatenate([aet, np.arange(next_edge, end)])
+            next_edge = end
         
-        # Ignora arestas horizontais
-        if p1[1] == p2[1]:
-            continue
+        # Remove da AET as arestas que terminam em y
+        aet = aet[et_y_max[aet] > y]
         
-        # Garante que p1.y <= p2.y
-        if p1[1] > p2[1]:
-            p1, p2 = p2, p1
+        # Ordena a AET por x
+        aet = aet[np.argsort(x[aet], kind='stable')]
         
-        y_min = p1[1]
-        y_max = p2[1]
-        x = p1[0]
-        slope_inv = (p2[0] - p1[0]) / (p2[1] - p1[1])
+        # Preenche entre pares de arestas
+        pairs = len(aet) // 2
+        x_start = x[aet[0:2 * pairs:2]].astype(np.int64)
+        x_end = x[aet[1:2 * pairs:2]].astype(np.int64)
+        keep = x_start <= x_end
+        if keep.any():
+            spans.append(np.column_stack([x_start[keep], x_end[keep],
+                                          np.full(keep.sum(), y)]))
         
-        et.append(Edge(y_min, y_max, x, slope_inv))
+        # Atualiza x para próxima linha
+        x[aet] += et_inv[aet]
     
-    # Ordena a ET por y_min
-    et.sort(key=lambda edge: edge.y_min)
-    return et
+    if not spans:
+        return np.empty((0, 3), dtype=np.int64)
+    return np.concatenate(spans)
+
+def _scanline_spans(et_y_min, et_y_max, et_x, et_inv, y_min, y_max):
+    """Calcula os spans da varredura com laços simples, para o Numba
+
+    Mesmo resultado de _scanline_spans_numpy: a AET é um array de índices
+    pré-alocado, ordenado por inserção (estável) a cada linha.
+
+    Returns:
+        np.ndarray: Spans (x_start, x_end, y) em int64, um por linha
+    """
+    n = len(et_y_min)
+    x = et_x.copy()  # x atual de cada aresta
+    aet = np.empty(n, dtype=np.int64)
+    active = 0
+    next_edge = 0
+    
+    # No máximo n // 2 spans por linha de varredura
+    spans = np.empty(((n // 2) * (y_max - y_min + 1), 3), dtype=np.int64)
+    count = 0
+    
+    for y in range(y_min, y_max + 1):
+        # Adiciona à AET as arestas que começam em y
+        while next_edge < n and et_y_min[next_edge] <= y:
+            aet[active] = next_edge
+            active += 1
+            next_edge += 1
+        
+        # Remove da AET as arestas que terminam em y
+        kept = 0
+        for i in range(active):
+            if et_y_max[aet[i]] > y:
+                aet[kept] = aet[i]
+                kept += 1
+        active = kept
+        
+        # Ordena a AET por x (inserção, a AET quase não muda entre linhas)
+        for i in range(1, active):
+            edge = aet[i]
+            j = i - 1
+            while j >= 0 and x[aet[j]] > x[edge]:
+                aet[j + 1] = aet[j]
+                j -= 1
+            aet[j + 1] = edge
+        
+        # Preenche entre pares de arestas
+        for i in range(0, active - 1, 2):
+            x_start = int(x[aet[i]])
+            x_end = int(x[aet[i + 1]])
+            if x_start <= x_end:
+                spans[count, 0] = x_start
+                spans[count, 1] = x_end
+                spans[count, 2] = y
+                count += 1
+        
+        # Atualiza x para próxima linha
+        for i in range(active):
+            x[aet[i]] += et_inv[aet[i]]
+    
+    return spans[:count]
+
+# Versão compilada (None quando o Numba não está instalado)
+_scanline_spans_jit = njit(cache=True)(_scanline_spans) if njit else None
 
 def fill_polygon(points):
-    """Preenche o polígono usando o algoritmo de coerência de arestas"""
+    """Preenche o polígono usando o algoritmo de coerência de arestas
+
+    Os spans de todas as linhas de varredura são acumulados e enviados ao
+    OpenGL de uma vez, como segmentos GL_LINES num único glDrawArrays.
+    """
     if len(points) < 3:
         return
     
-    # Cria a ET
+    if use_gpu_fill:
+        fill_polygon_gpu(points)
+        return
+    
+    # Cria a ET (arrays ordenados por y_min)
     et = create_et(points)
     
     # Encontra y_min e y_max do polígono
-    y_min = min(p[1] for p in points)
-    y_max = max(p[1] for p in points)
+    y_min = int(min(p[1] for p in points))
+    y_max = int(max(p[1] for p in points))
     
-    # Inicializa a AET
-    aet = []
+    # Spans (x_start, x_end, y) de todas as linhas de varredura
+    if _scanline_spans_jit is not None:
+        spans = _scanline_spans_jit(et['y_min'], et['y_max'], et['x'], et['inv'],
+                                    y_min, y_max)
+    else:
+        spans = _scanline_spans_numpy(et, y_min, y_max)
     
-    # Configurações OpenGL para desenho de pontos
-    glDisable(GL_LINE_SMOOTH)
-    glPointSize(1.0)
-    glColor3f(fill_color[0], fill_color[1], fill_color[2])
-    glBegin(GL_POINTS)
+    if len(spans) == 0:
+        return
     
-    # Para cada linha de varredura
-    for y in range(int(y_min), int(y_max) + 1):
-        # Adiciona à AET as arestas que começam em y
-        i = 0
-        while i < len(et):
-            if et[i].y_min == y:
-                aet.append(et[i])
-                et.pop(i)
-            else:
-                i += 1
-        
-        # Remove da AET as arestas que terminam em y
-        aet = [edge for edge in aet if edge.y_max > y]
-        
-        # Ordena a AET por x
-        aet.sort()
-        
-        # Preenche entre pares de arestas
-        for i in range(0, len(aet), 2):
-            if i + 1 < len(aet):
-                x_start = int(aet[i].x)
-                x_end = int(aet[i + 1].x)
-                
-                # Desenha pontos na linha horizontal
-                for x in range(x_start, x_end + 1):
-                    glVertex2i(x, y)
-        
-        # Atualiza x para próxima linha
-        for edge in aet:
-            edge.x += edge.slope_inv
+    # Cada span vira um segmento do centro do pixel x_start até o centro
+    # de x_end + 1: pela regra diamond-exit, acende x_start..x_end
+    spans = spans.astype(np.float32)
+    vertices = np.empty((len(spans), 2, 2), dtype=np.float32)
+    vertices[:, 0, 0] = spans[:, 0] + 0.5
+    vertices[:, 1, 0] = spans[:, 1] + 1.5
+    vertices[:, :, 1] = spans[:, 2, None] + 0.5
     
-    glEnd()
+    # Configurações OpenGL para desenho das linhas
+    glDisable(GL_LINE_SMOOTH)
+    glLineWidth(1.0)
+    glColor3f(fill_color[0], fill_color[1], fill_color[2])
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(2, GL_FLOAT, 0, vertices)
+    glDrawArrays(GL_LINES, 0, 2 * len(spans))
+    glDisableClientState(GL_VERTEX_ARRAY)
     glEnable(GL_LINE_SMOOTH)
 
 def draw_polygon(points):
@@ -152,7 +316,27 @@ def draw_text(x, y, text):
     glMatrixMode(GL_MODELVIEW)
 
 def draw_interface():
-    """Desenha a interface do usuário"""
+    """Desenha a interface do usuário
+
+    Os comandos (quads dos botões e textos GLUT) ficam gravados numa
+    display list; ela só é regravada quando a espessura ou a cor, mostradas
+    nos botões, mudam. Nos demais frames basta um glCallList.
+    """
+    global _interface_list, _interface_key
+    
+    key = (line_thickness, tuple(fill_color))
+    if _interface_list is None:
+        _interface_list = glGenLists(1)
+    if key != _interface_key:
+        glNewList(_interface_list, GL_COMPILE)
+        build_interface()
+        glEndList()
+        _interface_key = key
+    
+    glCallList(_interface_list)
+
+def build_interface():
+    """Emite os comandos OpenGL da interface (gravados por draw_interface)"""
     # Fundo da interface
     glColor3f(0.8, 0.8, 0.8)
     glBegin(GL_QUADS)
@@ -293,6 +477,10 @@ def main():
     
     clock = pygame.time.Clock()
     
+    # A cena só é redesenhada (e o preenchimento refeito) quando algo
+    # mudou: clique, Enter ou a janela precisar ser reexibida
+    needs_redraw = True
+    
     while True:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -303,11 +491,21 @@ def main():
                 if event.button == 1:  # Botão esquerdo do mouse
                     x, y = event.pos
                     handle_mouse_click(x, y)
+                    needs_redraw = True
             
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RETURN and drawing_mode and len(current_polygon) >= 3:
                     polygons.append(current_polygon.copy())
                     current_polygon = []
+                    needs_redraw = True
+            
+            if event.type == pygame.VIDEOEXPOSE:
+                needs_redraw = True
+        
+        if not needs_redraw:
+            clock.tick(60)
+            continue
+        needs_redraw = False
         
         # Limpa a tela
         glClear(GL_COLOR_BUFFER_BIT)
@@ -4,6 +4,7 @@
 Qt + OpenGL polygon fill using Edge Table (ET) and Active Edge Table (AET)
 -----------------------------------------------------------------------------
 Requirements:
+  - Python 3.10+
   - PyQt6
   - PyOpenGL
 
@@ -25,7 +26,8 @@ Usage:
 Notes:
   • Works for simple (possibly concave) polygons. Self‑intersecting polygons are
     not guaranteed to be handled.
-  • Filling is implemented by computing scanline spans and drawing them as GL_LINES.
+  • Filling is implemented by computing scanline spans and drawing them as GL_LINES
+    from a vertex buffer staged with the stdlib array module.
   • Coordinate system: origin at top-left, y growing downward (orthographic).
 
 Author: (fill with your group members)
@@ -33,6 +35,7 @@ Author: (fill with your group members)
 from __future__ import annotations
 
 import sys
+from array import array
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 
@@ -52,11 +55,14 @@ from OpenGL.GL import (
     glOrtho, glBegin, glEnd, glVertex2f, GL_LINES, GL_LINE_LOOP,
     glLineWidth, glColor4f, glEnable, GL_BLEND, glBlendFunc,
     GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, GL_POINT_SMOOTH,
-    GL_LINE_SMOOTH, glPointSize
+    GL_LINE_SMOOTH, glPointSize,
+    glGenBuffers, glBindBuffer, glBufferData, GL_ARRAY_BUFFER, GL_STATIC_DRAW,
+    glEnableClientState, glDisableClientState, GL_VERTEX_ARRAY,
+    glVertexPointer, GL_FLOAT, glDrawArrays
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Edge:
     ymax: int
     x: float
@@ -73,6 +79,9 @@ class GLCanvas(QOpenGLWidget):
         self.stroke_color: QColor = QColor(30, 30, 30)
         self.stroke_width: int = 2
         self.filled_spans: List[Tuple[int, float, float]] = []  # (y, x_left, x_right)
+        self._span_vbo = None
+        self._span_vertex_count: int = 0
+        self._spans_dirty: bool = False
         self.hover_pos: Optional[QPointF] = None
         self.bg_color = QColor(245, 246, 248)
         self.show_vertices: bool = True
@@ -85,6 +94,7 @@ class GLCanvas(QOpenGLWidget):
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
         glEnable(GL_POINT_SMOOTH)
         glEnable(GL_LINE_SMOOTH)
+        self._span_vbo = glGenBuffers(1)
 
     def resizeGL(self, w: int, h: int):
         # 2D orthographic projection: origin top-left
@@ -102,11 +112,14 @@ class GLCanvas(QOpenGLWidget):
             r, g, b, a = self.fill_color.redF(), self.fill_color.greenF(), self.fill_color.blueF(), self.fill_color.alphaF()
             glColor4f(r, g, b, a)
             glLineWidth(1)
-            glBegin(GL_LINES)
-            for y, x1, x2 in self.filled_spans:
-                glVertex2f(x1, float(y) + 0.5)
-                glVertex2f(x2, float(y) + 0.5)
-            glEnd()
+            glBindBuffer(GL_ARRAY_BUFFER, self._span_vbo)
+            if self._spans_dirty:
+                self._upload_spans()
+            glEnableClientState(GL_VERTEX_ARRAY)
+            glVertexPointer(2, GL_FLOAT, 0, None)
+            glDrawArrays(GL_LINES, 0, self._span_vertex_count)
+            glDisableClientState(GL_VERTEX_ARRAY)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
 
         # Draw polygon outline
         if len(self.points) >= 2:
@@ -148,6 +161,15 @@ class GLCanvas(QOpenGLWidget):
             glVertex2f(self.hover_pos.x(), self.hover_pos.y())
             glEnd()
 
+    def _upload_spans(self):
+        # stage all span endpoints in a stdlib float array and send them in one call
+        flat = [v for y, x1, x2 in self.filled_spans for v in (x1, y + 0.5, x2, y + 0.5)]
+        buf = array('f')
+        buf.fromlist(flat)
+        glBufferData(GL_ARRAY_BUFFER, buf.buffer_info()[1] * buf.itemsize, buf.tobytes(), GL_STATIC_DRAW)
+        self._span_vertex_count = len(self.filled_spans) * 2
+        self._spans_dirty = False
+
     # ---------- Interaction ----------
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton and not self.closed:
@@ -192,6 +214,7 @@ class GLCanvas(QOpenGLWidget):
             return
         spans = self.compute_scanline_spans([(p.x(), p.y()) for p in self.points], int(self.height()))
         self.filled_spans = spans
+        self._spans_dirty = True
         self.update()
 
     # ---------- ET / AET implementation ----------
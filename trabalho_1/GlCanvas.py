@@ -2,16 +2,24 @@ from __future__ import annotations
 
 from typing import List, Tuple, Optional
 
-from PyQt6.QtCore import Qt, QPointF
+import numpy as np
+
+# Numba é opcional: sem ele compute_scanline_spans usa a versão vetorizada em NumPy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+from PyQt6.QtCore import Qt, QPointF, QTimer, QThreadPool
 from PyQt6.QtWidgets import (
     QWidget, QMessageBox
 )
 
-from PyQt6.QtGui import QColor
+from PyQt6.QtGui import QColor, QSurfaceFormat
 
 from PyQt6.QtOpenGLWidgets import QOpenGLWidget
 
-from Edge import Edge
+from SpanJob import SpanJob
 
 # PyOpenGL
 from OpenGL.GL import (
@@ -20,9 +28,98 @@ from OpenGL.GL import (
     glOrtho, glBegin, glEnd, glVertex2f, GL_LINES, GL_LINE_LOOP,
     glLineWidth, glColor4f, glEnable, GL_BLEND, glBlendFunc,
     GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, GL_POINT_SMOOTH,
-    GL_LINE_SMOOTH, glPointSize
+    GL_LINE_SMOOTH, glPointSize, glGenBuffers, glBindBuffer, glBufferData,
+    GL_ARRAY_BUFFER, GL_STATIC_DRAW, glEnableClientState, glDisableClientState,
+    GL_VERTEX_ARRAY, glVertexPointer, glDrawArrays, GL_FLOAT,
+    GL_STENCIL_BUFFER_BIT, GL_STENCIL_TEST, glDisable, glColorMask,
+    glStencilFunc, glStencilOp, GL_ALWAYS, GL_EQUAL, GL_KEEP, GL_INVERT,
+    GL_TRIANGLE_FAN, GL_QUADS, GL_FALSE, GL_TRUE
 )
 
+# Ponto fixo 16.16 para X e inv_slope na AET: 1.0 vale _FX_ONE
+_FX_SHIFT = 16
+_FX_ONE = 1 << _FX_SHIFT
+
+
+def _scanline_kernel(et_ymin: np.ndarray, et_ymax: np.ndarray, et_x: np.ndarray, et_inv: np.ndarray) -> np.ndarray:
+    """ 
+    Laço ET/AET com escalares e arrays pré-alocados, no formato que o Numba compila (@njit). 
+    Produz os mesmos spans da versão NumPy de GLCanvas.compute_scanline_spans: a AET guarda índices 
+    de arestas e é ordenada por inserção (estável) por (x, inv_slope) a cada linha. 
+    
+    Args: 
+    
+    et_ymin, et_ymax: linhas inicial e final de cada aresta, como retornadas por GLCanvas.build_edge_table (não vazia). 
+    
+    et_x, et_inv: X inicial e inverso da inclinação em ponto fixo 16.16 (int64). 
+    
+    Returns: array float32 (N, 3) com linhas (y, x_esquerda, x_direita). 
+    """
+
+    n = len(et_ymin)
+    y0, y1 = et_ymin[0], et_ymax.max()
+    x = et_x.copy()
+    scale = 1.0 / _FX_ONE
+    aet = np.empty(n, dtype=np.int64)
+    active = 0
+    next_edge = 0
+
+    # No máximo n // 2 spans por linha
+    spans = np.empty(((n // 2) * (y1 - y0 + 1), 3), dtype=np.float32)
+    count = 0
+
+    for y in range(y0, y1 + 1):
+
+        while next_edge < n and et_ymin[next_edge] == y:
+            aet[active] = next_edge
+            active += 1
+            next_edge += 1
+
+        kept = 0
+        for i in range(active):
+            if et_ymax[aet[i]] >= y:
+                aet[kept] = aet[i]
+                kept += 1
+        active = kept
+
+        for i in range(1, active):
+            e = aet[i]
+            j = i - 1
+            while j >= 0 and (x[aet[j]] > x[e] or (x[aet[j]] == x[e] and et_inv[aet[j]] > et_inv[e])):
+                aet[j + 1] = aet[j]
+                j -= 1
+            aet[j + 1] = e
+
+        for i in range(0, active - 1, 2):
+            x_left = min(x[aet[i]], x[aet[i + 1]])
+            x_right = max(x[aet[i]], x[aet[i + 1]])
+            if x_right > x_left:
+                spans[count, 0] = y
+                spans[count, 1] = x_left * scale
+                spans[count, 2] = x_right * scale
+                count += 1
+
+        for i in range(active):
+            x[aet[i]] += et_inv[aet[i]]
+
+    return spans[:count]
+
+
+# Versão compilada do kernel (None quando o Numba não está instalado); cache=True guarda a compilação em disco.
+# nogil=True libera o GIL durante o laço, já que ele roda numa thread do QThreadPool (ver SpanJob)
+_scanline_kernel_jit = njit(cache=True, nogil=True)(_scanline_kernel) if njit is not None else None
+
+
+# Polígonos de exemplo em coordenadas normalizadas ([0, 1] da largura e da altura do canvas)
+_EXAMPLES_NORMALIZED = {
+    "Convex pentagon": np.array([
+        [0.25, 0.2], [0.75, 0.25], [0.8, 0.65], [0.5, 0.85], [0.2, 0.6]
+    ]),
+    "Concave arrow": np.array([
+        [0.2, 0.2], [0.7, 0.2], [0.7, 0.05], [0.95, 0.35],
+        [0.7, 0.65], [0.7, 0.5], [0.2, 0.5]
+    ]),
+}
 
 
 class GLCanvas(QOpenGLWidget):
@@ -42,7 +139,7 @@ class GLCanvas(QOpenGLWidget):
     
     stroke_width (int): espessura da linha de contorno. 
     
-    filled_spans (List[Tuple[int,float,float]]): spans calculados para preenchimento (cada tupla é (y, x_esquerda, x_direita)). 
+    filled_spans (np.ndarray): spans calculados para preenchimento, array float32 (N, 3) em que cada linha é (y, x_esquerda, x_direita). 
     
     hover_pos (Optional[QPointF]): posição do mouse para visualização. 
     
@@ -51,21 +148,49 @@ class GLCanvas(QOpenGLWidget):
     show_vertices (bool): exibe ou não os marcadores dos vértices. 
     
     snap_preview (bool): ativa visualização de aresta até o cursor. 
+    
+    stencil_fill (bool): se True, o preenchimento é feito pela GPU no stencil buffer (regra par-ímpar) em vez dos spans ET/AET. 
     """
 
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.setMouseTracking(True)
+
+        # Stencil buffer para o preenchimento via GPU
+        fmt = QSurfaceFormat(self.format())
+        fmt.setStencilBufferSize(8)
+        self.setFormat(fmt)
+
         self.points: List[QPointF] = []  # current polygon points
         self.closed: bool = False
         self.fill_color: QColor = QColor(0, 128, 255, 180)
         self.stroke_color: QColor = QColor(30, 30, 30)
+        # Componentes float das cores, calculadas uma vez (e em set_fill_color) em vez de a cada paintGL
+        self._fill_rgba = (self.fill_color.redF(), self.fill_color.greenF(), self.fill_color.blueF(), self.fill_color.alphaF())
+        self._stroke_rgba = (self.stroke_color.redF(), self.stroke_color.greenF(), self.stroke_color.blueF(), 1.0)
         self.stroke_width: int = 2
-        self.filled_spans: List[Tuple[int, float, float]] = []  # (y, x_left, x_right)
+        self.filled_spans: np.ndarray = np.empty((0, 3), dtype=np.float32)  # (y, x_left, x_right)
         self.hover_pos: Optional[QPointF] = None
+        # Repaints de hover agrupados em no máximo um a cada 16 ms (~60 Hz)
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(16)
+        self._hover_timer.timeout.connect(self.update)
         self.bg_color = QColor(245, 246, 248)
         self.show_vertices: bool = True
         self.snap_preview: bool = True
+        self._span_vbo = None  # VBO com os segmentos dos spans (criado em initializeGL)
+        self._span_vertex_count: int = 0
+        self._spans_dirty: bool = False
+        self._vertex_vbo = None  # VBO com as cruzes dos vértices (criado em initializeGL)
+        self._vertex_count: int = 0
+        self._points_dirty: bool = False
+        self.stencil_fill: bool = False
+        self._stencil_filled: bool = False  # polígono atual preenchido pelo stencil
+        # Cálculo dos spans em segundo plano: cada preenchimento (ou descarte) avança a geração,
+        # e resultados de gerações antigas são ignorados
+        self._fill_generation: int = 0
+        self._span_job: Optional[SpanJob] = None
 
     # ---------- OpenGL ----------
     def initializeGL(self):
@@ -79,6 +204,8 @@ class GLCanvas(QOpenGLWidget):
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
         glEnable(GL_POINT_SMOOTH)
         glEnable(GL_LINE_SMOOTH)
+        self._span_vbo = glGenBuffers(1)
+        self._vertex_vbo = glGenBuffers(1)
 
     def resizeGL(self, w: int, h: int):
         """ 
@@ -103,18 +230,23 @@ class GLCanvas(QOpenGLWidget):
         glClear(GL_COLOR_BUFFER_BIT)
         glLoadIdentity()
 
-        if self.filled_spans:
-            r, g, b, a = self.fill_color.redF(), self.fill_color.greenF(), self.fill_color.blueF(), self.fill_color.alphaF()
-            glColor4f(r, g, b, a)
-            glLineWidth(1)
-            glBegin(GL_LINES)
-            for y, x1, x2 in self.filled_spans:
-                glVertex2f(x1, float(y) + 0.5)
-                glVertex2f(x2, float(y) + 0.5)
-            glEnd()
+        if self._stencil_filled:
+            self._draw_stencil_fill()
+
+        if self._spans_dirty:
+            self._upload_spans()
+
+        if self._span_vertex_count:
+            glColor4f(*self._fill_rgba)
+            glBindBuffer(GL_ARRAY_BUFFER, self._span_vbo)
+            glEnableClientState(GL_VERTEX_ARRAY)
+            glVertexPointer(2, GL_FLOAT, 0, None)
+            glDrawArrays(GL_QUADS, 0, self._span_vertex_count)
+            glDisableClientState(GL_VERTEX_ARRAY)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
 
         if len(self.points) >= 2:
-            glColor4f(self.stroke_color.redF(), self.stroke_color.greenF(), self.stroke_color.blueF(), 1.0)
+            glColor4f(*self._stroke_rgba)
             glLineWidth(float(self.stroke_width))
             glBegin(GL_LINE_LOOP if self.closed else GL_LINES)
             if self.closed:
@@ -130,17 +262,16 @@ class GLCanvas(QOpenGLWidget):
 
 
         if self.show_vertices and self.points:
+            if self._points_dirty:
+                self._upload_vertex_crosses()
             glPointSize(6)
             glColor4f(0.1, 0.1, 0.1, 1.0)
-            glBegin(GL_LINES)
-            s = 4
-            for p in self.points:
-                x, y = p.x(), p.y()
-                glVertex2f(x - s, y)
-                glVertex2f(x + s, y)
-                glVertex2f(x, y - s)
-                glVertex2f(x, y + s)
-            glEnd()
+            glBindBuffer(GL_ARRAY_BUFFER, self._vertex_vbo)
+            glEnableClientState(GL_VERTEX_ARRAY)
+            glVertexPointer(2, GL_FLOAT, 0, None)
+            glDrawArrays(GL_LINES, 0, self._vertex_count)
+            glDisableClientState(GL_VERTEX_ARRAY)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
 
         if self.hover_pos and (not self.closed) and self.points:
 
@@ -152,6 +283,80 @@ class GLCanvas(QOpenGLWidget):
             glVertex2f(self.hover_pos.x(), self.hover_pos.y())
             glEnd()
 
+    def _upload_spans(self):
+        """ 
+        Envia os spans para o VBO como retângulos GL_QUADS de 1 pixel de altura, de (x_esquerda, y) até (x_direita, y + 1). 
+        O rasterizador cobre exatamente a linha y, sem o deslocamento de meio pixel e sem a suavização 
+        (GL_LINE_SMOOTH) que as linhas aplicavam nas pontas dos spans. 
+        Chamado pelo paintGL (com o contexto ativo) apenas quando filled_spans mudou. 
+        """
+
+        spans = self.filled_spans
+        verts = np.empty((len(spans), 4, 2), dtype=np.float32)
+        verts[:, 0::3, 0] = spans[:, 1, None]   # (x_esquerda, y) e (x_esquerda, y + 1)
+        verts[:, 1:3, 0] = spans[:, 2, None]    # (x_direita, y) e (x_direita, y + 1)
+        verts[:, 0:2, 1] = spans[:, 0, None]
+        verts[:, 2:4, 1] = spans[:, 0, None] + 1
+
+        self._span_vertex_count = 4 * len(spans)
+        if self._span_vertex_count:
+            glBindBuffer(GL_ARRAY_BUFFER, self._span_vbo)
+            glBufferData(GL_ARRAY_BUFFER, verts.nbytes, verts, GL_STATIC_DRAW)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self._spans_dirty = False
+
+    def _upload_vertex_crosses(self):
+        """ 
+        Envia para o VBO as cruzes dos vértices: dois segmentos GL_LINES (horizontal e vertical, meia-largura 4) por ponto. 
+        Chamado pelo paintGL apenas quando a lista de pontos mudou. 
+        """
+
+        s = 4
+        pts = np.array([(p.x(), p.y()) for p in self.points], dtype=np.float32)
+        data = np.repeat(pts, 4, axis=0)
+        data[0::4, 0] -= s
+        data[1::4, 0] += s
+        data[2::4, 1] -= s
+        data[3::4, 1] += s
+
+        self._vertex_count = len(data)
+        glBindBuffer(GL_ARRAY_BUFFER, self._vertex_vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self._points_dirty = False
+
+    def _draw_stencil_fill(self):
+        """ 
+        Preenche o polígono na GPU: um leque de triângulos inverte o bit do stencil em cada pixel coberto 
+        (regra par-ímpar, como os pares da AET); depois um único retângulo na cor de preenchimento 
+        é desenhado só onde o bit ficou em 1. 
+        """
+
+        pts = np.array([(p.x(), p.y()) for p in self.points], dtype=np.float32)
+
+        glClear(GL_STENCIL_BUFFER_BIT)
+        glEnable(GL_STENCIL_TEST)
+        glColorMask(GL_FALSE, GL_FALSE, GL_FALSE, GL_FALSE)
+        glStencilFunc(GL_ALWAYS, 0, 1)
+        glStencilOp(GL_KEEP, GL_KEEP, GL_INVERT)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 0, pts)
+        glDrawArrays(GL_TRIANGLE_FAN, 0, len(pts))
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+        glColorMask(GL_TRUE, GL_TRUE, GL_TRUE, GL_TRUE)
+        glStencilFunc(GL_EQUAL, 1, 1)
+        glStencilOp(GL_KEEP, GL_KEEP, GL_KEEP)
+        (x_min, y_min), (x_max, y_max) = pts.min(axis=0), pts.max(axis=0)
+        glColor4f(*self._fill_rgba)
+        glBegin(GL_QUADS)
+        glVertex2f(x_min, y_min)
+        glVertex2f(x_max, y_min)
+        glVertex2f(x_max, y_max)
+        glVertex2f(x_min, y_max)
+        glEnd()
+        glDisable(GL_STENCIL_TEST)
+
     # ---------- Interacao ----------
     def mousePressEvent(self, event):
         """ 
@@ -162,7 +367,8 @@ class GLCanvas(QOpenGLWidget):
 
         if event.button() == Qt.MouseButton.LeftButton and not self.closed:
             self.points.append(QPointF(event.position().x(), event.position().y()))
-            self.filled_spans.clear()
+            self._points_dirty = True
+            self._reset_fill()
             self.update()
         elif event.button() == Qt.MouseButton.RightButton:
 
@@ -171,13 +377,50 @@ class GLCanvas(QOpenGLWidget):
 
     def mouseMoveEvent(self, event):
         """ 
-        Atualiza a posição atual do cursor (hover_pos) e solicita redesenho. 
+        Atualiza a posição atual do cursor (hover_pos) e agenda um redesenho. 
+        
+        A linha até o cursor só aparece com o polígono aberto e com ao menos um vértice; fora disso 
+        nada é redesenhado. Os movimentos dentro de 16 ms geram um único paintGL. 
         """
 
         self.hover_pos = QPointF(event.position().x(), event.position().y())
-        self.update()
+        if self.closed or not self.points:
+            return
+        if not self._hover_timer.isActive():
+            self._hover_timer.start()
 
     # ---------- Operacoes ----------
+    def set_filled_spans(self, spans: np.ndarray):
+        """ 
+        Substitui os spans de preenchimento; o VBO é reenviado no próximo paintGL. 
+        """
+
+        self.filled_spans = spans
+        self._spans_dirty = True
+
+    def _reset_fill(self):
+        """ 
+        Descarta o preenchimento atual (spans e stencil). 
+        """
+
+        self.set_filled_spans(np.empty((0, 3), dtype=np.float32))
+        self._stencil_filled = False
+        self._fill_generation += 1
+
+    def set_stencil_fill(self, enabled: bool):
+        """ 
+        Alterna entre o preenchimento por spans ET/AET e o preenchimento via stencil na GPU. 
+        Um polígono já preenchido (ou com spans ainda sendo calculados) é preenchido de novo no modo escolhido. 
+        """
+
+        pending = self._span_job is not None and self._span_job.generation == self._fill_generation
+        was_filled = self._stencil_filled or len(self.filled_spans) > 0 or pending
+        self.stencil_fill = bool(enabled)
+        if was_filled:
+            self.fill()
+        else:
+            self.update()
+
     def set_stroke_width(self, w: int):
         """ 
         Ajusta a espessura do traço do polígono. 
@@ -192,6 +435,7 @@ class GLCanvas(QOpenGLWidget):
         """
 
         self.fill_color = c
+        self._fill_rgba = (c.redF(), c.greenF(), c.blueF(), c.alphaF())
         self.update()
 
     def clear(self):
@@ -200,8 +444,9 @@ class GLCanvas(QOpenGLWidget):
         """
 
         self.points.clear()
+        self._points_dirty = True
         self.closed = False
-        self.filled_spans.clear()
+        self._reset_fill()
         self.update()
 
     def close_polygon(self):
@@ -211,7 +456,7 @@ class GLCanvas(QOpenGLWidget):
 
         if len(self.points) >= 3:
             self.closed = True
-            self.filled_spans.clear()
+            self._reset_fill()
             self.update()
         else:
             QMessageBox.information(self, "Info", "Adicione pelo menos 3 pontos antes de fechar o polígono.")
@@ -219,21 +464,46 @@ class GLCanvas(QOpenGLWidget):
     def fill(self):
         """ 
         Executa o algoritmo de preenchimento ET/AET no polígono fechado e armazena os spans resultantes para desenho. 
+        O cálculo roda no QThreadPool (SpanJob) para não travar a interface; os spans chegam em _on_spans_ready. 
+        Com stencil_fill ativo, apenas marca o polígono para ser preenchido pela GPU no paintGL. 
         """
 
         if not self.closed:
             QMessageBox.information(self, "Info", "Feche o polígono antes de preencher.")
             return
-        spans = self.compute_scanline_spans([(p.x(), p.y()) for p in self.points], int(self.height()))
-        self.filled_spans = spans
+        if self.stencil_fill:
+            self._reset_fill()
+            self._stencil_filled = True
+            self.update()
+            return
+        self._stencil_filled = False  # ao sair do modo stencil, só os spans são desenhados
+        self._fill_generation += 1
+        job = SpanJob(self.compute_scanline_spans, [(p.x(), p.y()) for p in self.points],
+                      int(self.height()), self._fill_generation)
+        job.signals.finished.connect(self._on_spans_ready)
+        self._span_job = job  # mantém os sinais vivos até o resultado chegar
+        QThreadPool.globalInstance().start(job)
+
+    def _on_spans_ready(self, spans: np.ndarray, generation: int):
+        """ 
+        Recebe (na thread da interface) os spans calculados por SpanJob. 
+        Resultados de um preenchimento já descartado ou substituído são ignorados. 
+        """
+
+        if generation != self._fill_generation:
+            return
+        self._span_job = None
+        self.set_filled_spans(spans)
         self.update()
 
     # ---------- ET / AET ----------
     @staticmethod
-    def build_edge_table(vertices: List[Tuple[float, float]], height: int) -> List[List[Edge]]:
+    def build_edge_table(vertices: List[Tuple[float, float]], height: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """ 
-        Constrói a Tabela de Arestas (ET). 
-        Cada linha Y da tela possui uma lista de arestas que começam nela. 
+        Constrói a Tabela de Arestas (ET) em colunas NumPy (SoA). 
+        Cada aresta é uma posição nos quatro arrays, ordenados (de forma estável) pela linha Y onde a aresta começa. 
+        Uma aresta cobre as linhas inteiras y com ymin <= y < ymax (de ceil(ymin) até ceil(ymax) - 1); 
+        arestas horizontais, ou que não cruzam nenhuma linha inteira, ficam de fora. 
         
         Args: 
         
@@ -241,119 +511,115 @@ class GLCanvas(QOpenGLWidget):
         
         height: altura da tela. 
         
-        Returns: ET (lista de listas de Edge). 
+        Returns: ET como (ymin, ymax, x, inv_slope): linha inicial e final (int64), X na linha inicial e inverso da inclinação (float64). 
         """
 
-        n = len(vertices)
-        ET: List[List[Edge]] = [[] for _ in range(height + 1)]
+        v = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+        x1, y1 = v[:, 0], v[:, 1]
+        x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
 
-        for i in range(n):
-            x1, y1 = vertices[i]
-            x2, y2 = vertices[(i + 1) % n]
+        # Orienta cada aresta de baixo (ymin) para cima (ymax)
+        up = y1 < y2
+        ymin = np.where(up, y1, y2)
+        ymax = np.where(up, y2, y1)
+        x_at_ymin = np.where(up, x1, x2)
+        dy = ymax - ymin
+        dx = np.where(up, x2 - x1, x1 - x2)
 
-            if int(round(y1)) == int(round(y2)):
-                continue
+        # Intervalo semiaberto [ymin, ymax) de linhas inteiras, limitado à tela
+        y_start = np.maximum(0, np.ceil(np.minimum(ymin, height))).astype(np.int64)
+        y_end = np.minimum(height, np.ceil(np.maximum(0, ymax)) - 1).astype(np.int64)
 
-            if y1 < y2:
-                ymin, ymax = y1, y2
-                x_at_ymin = x1
-                dy = y2 - y1
-                dx = x2 - x1
-            else:
-                ymin, ymax = y2, y1
-                x_at_ymin = x2
-                dy = y1 - y2
-                dx = x1 - x2
+        # Arestas horizontais (dy == 0) ficam com y_start > y_end e são descartadas
+        valid = (dy > 0) & (y_start <= height) & (y_start <= y_end)
 
+        with np.errstate(divide='ignore', invalid='ignore'):
             inv_slope = dx / dy  # 1/m
+            x_int = x_at_ymin + inv_slope * (y_start - ymin)
 
-            y_start = int(max(0, int(round(min(ymin, height)))))
-            y_end = int(min(height, int(round(max(0, ymax) - 1))))  
-
-            if dy != 0:
-                y_offset = (y_start + 0.0) - ymin
-                x_int = x_at_ymin + inv_slope * y_offset
-            else:
-                x_int = x_at_ymin
-
-            if 0 <= y_start <= height and y_start <= y_end:
-                ET[y_start].append(Edge(ymax=y_end, x=x_int, inv_slope=inv_slope))
-
-        return ET
+        order = np.argsort(y_start[valid], kind='stable')
+        return (y_start[valid][order], y_end[valid][order],
+                x_int[valid][order], inv_slope[valid][order])
 
     @staticmethod
-    def compute_scanline_spans(vertices: List[Tuple[float, float]], height: int) -> List[Tuple[int, float, float]]:
+    def compute_scanline_spans(vertices: List[Tuple[float, float]], height: int) -> np.ndarray:
         """ 
         Calcula os spans horizontais para preenchimento do polígono usando ET (Edge Table) e AET (Active Edge Table). 
         
+        Com o Numba instalado, o laço roda compilado em _scanline_kernel. Sem ele, a AET é mantida como arrays 
+        paralelos (x, inv_slope, ymax): a cada linha as arestas novas são anexadas por fatia, as encerradas 
+        saem por máscara e o incremento de X é uma única operação vetorial. 
+        Nos dois casos X e inv_slope andam em ponto fixo 16.16 (soma inteira por linha) e só viram float nos spans. 
+        
         Args: 
         
         vertices: lista de vértices (x, y) do polígono. 
         
         height: altura da tela. 
         
-        Returns: Lista de tuplas (y, x_esquerda, x_direita). 
+        Returns: array float32 (N, 3) com linhas (y, x_esquerda, x_direita). 
         """
 
-        ET = GLCanvas.build_edge_table(vertices, height)
-        AET: List[Edge] = []
-        spans: List[Tuple[int, float, float]] = []
+        et_ymin, et_ymax, et_x, et_inv = GLCanvas.build_edge_table(vertices, height)
+        if len(et_ymin) == 0:
+            return np.empty((0, 3), dtype=np.float32)
+
+        # int64 e não int32: arestas quase horizontais têm inv_slope grande demais para 16.16 em 32 bits
+        et_x = np.rint(et_x * _FX_ONE).astype(np.int64)
+        et_inv = np.rint(et_inv * _FX_ONE).astype(np.int64)
+        if _scanline_kernel_jit is not None:
+            return _scanline_kernel_jit(et_ymin, et_ymax, et_x, et_inv)
+
+        # Índices estilo CSR: as arestas que começam na linha y são et_start[y - y0]:et_start[y - y0 + 1]
+        y0, y1 = int(et_ymin[0]), int(et_ymax.max())
+        et_start = np.searchsorted(et_ymin, np.arange(y0, y1 + 2))
+
+        aet_x = np.empty(0, dtype=np.int64)
+        aet_inv = np.empty(0, dtype=np.int64)
+        aet_ymax = np.empty(0, dtype=np.int64)
+        spans: List[np.ndarray] = []
 
-        for y in range(0, height + 1):
+        for y in range(y0, y1 + 1):
 
-            for e in ET[y]:
-                AET.append(e)
+            first, last = et_start[y - y0], et_start[y - y0 + 1]
+            if last > first:
+                aet_x = np.concatenate((aet_x, et_x[first:last]))
+                aet_inv = np.concatenate((aet_inv, et_inv[first:last]))
+                aet_ymax = np.concatenate((aet_ymax, et_ymax[first:last]))
 
-            AET = [e for e in AET if y <= e.ymax]
+            keep = aet_ymax >= y
+            aet_x, aet_inv, aet_ymax = aet_x[keep], aet_inv[keep], aet_ymax[keep]
 
-            AET.sort(key=lambda e: (e.x, e.inv_slope))
+            order = np.lexsort((aet_inv, aet_x))
+            aet_x, aet_inv, aet_ymax = aet_x[order], aet_inv[order], aet_ymax[order]
 
-            it = iter(AET)
-            pairs = []
-            try:
-                while True:
-                    e1 = next(it)
-                    e2 = next(it)
-                    x_left = e1.x
-                    x_right = e2.x
-                    if x_left > x_right:
-                        x_left, x_right = x_right, x_left
-                    pairs.append((x_left, x_right))
-            except StopIteration:
-                pass
+            pairs = len(aet_x) // 2
+            x_left = aet_x[0:2 * pairs:2]
+            x_right = aet_x[1:2 * pairs:2]
+            x_left, x_right = np.minimum(x_left, x_right), np.maximum(x_left, x_right)
 
-            for x_left, x_right in pairs:
-                if x_right - x_left > 1e-6:
-                    spans.append((y, x_left, x_right))
+            wide = x_right > x_left
+            if wide.any():
+                spans.append(np.column_stack((np.full(wide.sum(), y), x_left[wide] / _FX_ONE, x_right[wide] / _FX_ONE)))
 
-            for e in AET:
-                e.x += e.inv_slope
+            aet_x += aet_inv
 
-        return spans
+        if not spans:
+            return np.empty((0, 3), dtype=np.float32)
+        return np.concatenate(spans).astype(np.float32)
 
     # ---------- Poligonos de Exemplo ----------
     def load_example(self, name: str):
         """ 
         Carrega polígonos de exemplo predefinidos (convexo, côncavo, etc.) 
         já fechados e prontos para preenchimento. 
+        Só o exemplo escolhido é escalado para o tamanho atual do canvas. 
         """
         
-        w, h = self.width(), self.height()
-        examples = {
-            "Convex pentagon": [
-                QPointF(0.25 * w, 0.2 * h), QPointF(0.75 * w, 0.25 * h),
-                QPointF(0.8 * w, 0.65 * h), QPointF(0.5 * w, 0.85 * h),
-                QPointF(0.2 * w, 0.6 * h)
-            ],
-            "Concave arrow": [
-                QPointF(0.2 * w, 0.2 * h), QPointF(0.7 * w, 0.2 * h),
-                QPointF(0.7 * w, 0.05 * h), QPointF(0.95 * w, 0.35 * h),
-                QPointF(0.7 * w, 0.65 * h), QPointF(0.7 * w, 0.5 * h),
-                QPointF(0.2 * w, 0.5 * h)
-            ],
-        }
-        if name in examples:
-            self.points = examples[name]
+        if name in _EXAMPLES_NORMALIZED:
+            coords = _EXAMPLES_NORMALIZED[name] * (self.width(), self.height())
+            self.points = [QPointF(x, y) for x, y in coords.tolist()]
+            self._points_dirty = True
             self.closed = True
-            self.filled_spans.clear()
+            self._reset_fill()
             self.update()
@@ -21,6 +21,8 @@ Requisitos:
 - Python 3.10 ou superior
 - PyQt6
 - PyOpenGL
+- NumPy
+- Numba (opcional: compila o laço ET/AET; sem ele é usada a versão em NumPy)
 
 Instalação e execução
 --------------------
@@ -42,7 +44,7 @@ Linux/macOS:
 **2. Instalar dependências**
     
 Windows/Linux/macOS (com venv ativo):
-    pip install PyQt6 PyOpenGL
+    pip install PyQt6 PyOpenGL numpy
 
 **3. Executar o programa**
 
@@ -1,3 +1,4 @@
+from functools import partial
 from PyQt6.QtWidgets import (
     QMainWindow, QToolBar, QColorDialog, QMessageBox, 
     QLabel, QSpinBox, QComboBox
@@ -6,6 +7,9 @@ from PyQt6.QtCore import Qt
 from GlCanvas import GLCanvas
 from PyQt6.QtGui import QAction
 
+# Rótulo exibido na interface -> chave do exemplo em GLCanvas.load_example
+_EXAMPLES = (("Convexo", "Convex pentagon"), ("Concavo", "Concave arrow"))
+
 class MainWindow(QMainWindow):
     """ 
     Janela principal da aplicação. Contém o canvas OpenGL e as ferramentas de interação (toolbar e menu). 
@@ -34,6 +38,8 @@ class MainWindow(QMainWindow):
         
         • preencher 
         
+        • alternar preenchimento via GPU (stencil) 
+        
         • limpar 
         
         • escolher cor 
@@ -57,6 +63,12 @@ class MainWindow(QMainWindow):
         act_fill.triggered.connect(self.canvas.fill)
         tb.addAction(act_fill)
 
+        # GPU (stencil) fill
+        act_stencil = QAction("Preencher via GPU", self)
+        act_stencil.setCheckable(True)
+        act_stencil.toggled.connect(self.canvas.set_stencil_fill)
+        tb.addAction(act_stencil)
+
         # Clear
         act_clear = QAction("Limpar", self)
         act_clear.triggered.connect(self.canvas.clear)
@@ -82,8 +94,10 @@ class MainWindow(QMainWindow):
         tb.addSeparator()
         tb.addWidget(QLabel("Exemplos:"))
         combo = QComboBox()
-        combo.addItems(["(Escolher)", "Convexo", "Concavo"])
-        combo.currentTextChanged.connect(self._on_example)
+        combo.addItems(["(Escolher)"] + [label for label, _ in _EXAMPLES])
+        # Índice do combo -> chave do exemplo (o índice 0 é o "(Escolher)")
+        self._example_keys = [None] + [key for _, key in _EXAMPLES]
+        combo.currentIndexChanged.connect(self._on_example)
         tb.addWidget(combo)
 
     def _make_menubar(self):
@@ -104,9 +118,9 @@ class MainWindow(QMainWindow):
         file_m.addAction(act_exit)
 
         ex_m = mb.addMenu("&Exemplos")
-        for name in ["Convexo", "Concavo"]:
-            act = QAction(name, self)
-            act.triggered.connect(lambda checked=False, n=name: self.canvas.load_example(n))
+        for label, key in _EXAMPLES:
+            act = QAction(label, self)
+            act.triggered.connect(partial(self.canvas.load_example, key))
             ex_m.addAction(act)
 
         help_m = mb.addMenu("&Ajuda")
@@ -127,7 +141,8 @@ class MainWindow(QMainWindow):
             "Preenchimento de polígonos usando Edge Table (ET) e Active Edge Table (AET)\n\n"
             "• Adicione vértices com o clique esquerdo. Clique direito alterna a exibição dos vértices.\n"
             "• Feche o polígono e depois clique em Preencher.\n"
-            "• Esta implementação desenha os spans por scanline usando GL_LINES.\n"
+            "• Esta implementação desenha cada span da scanline como um retângulo GL_QUADS de 1 pixel de altura.\n"
+            "• 'Preencher via GPU' usa o stencil buffer (regra par-ímpar) em vez da ET/AET.\n"
             "• Projetado para polígonos simples/concavos (não auto-intersectantes)."
         ))
 
@@ -141,13 +156,14 @@ class MainWindow(QMainWindow):
         if c.isValid():
             self.canvas.set_fill_color(c)
 
-    def _on_example(self, text: str):
+    def _on_example(self, index: int):
         """ 
         Carrega polígono de exemplo quando selecionado no dropdown. 
         """
 
-        if text and text != "(Escolher)":
-            self.canvas.load_example(text)
+        key = self._example_keys[index] if index >= 0 else None
+        if key is not None:
+            self.canvas.load_example(key)
 
     def _show_duo(self):
         QMessageBox.information(
@@ -0,0 +1,53 @@
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class SpanSignals(QObject):
+    """ 
+    Sinais emitidos por SpanJob. Como o objeto vive na thread da interface, a conexão com o canvas é enfileirada 
+    e o slot roda na thread da interface. 
+    
+    Sinais: 
+    
+    finished(np.ndarray, int): spans calculados e a geração do preenchimento que os pediu. 
+    """
+
+    finished = pyqtSignal(object, int)
+
+
+class SpanJob(QRunnable):
+    """ 
+    Tarefa do QThreadPool que calcula os spans ET/AET fora da thread da interface. 
+    
+    Atributos: 
+    
+    compute (Callable): função (vertices, height) -> spans, normalmente GLCanvas.compute_scanline_spans. 
+    
+    vertices (List[Tuple[float, float]]): vértices (x, y) do polígono, copiados como tuplas. 
+    
+    height (int): altura da tela. 
+    
+    generation (int): geração do preenchimento; resultados de gerações antigas são descartados pelo canvas. 
+    
+    signals (SpanSignals): emite finished ao terminar. 
+    """
+
+    def __init__(self, compute: Callable[[List[Tuple[float, float]], int], np.ndarray],
+                 vertices: List[Tuple[float, float]], height: int, generation: int):
+        super().__init__()
+        self.compute = compute
+        self.vertices = vertices
+        self.height = height
+        self.generation = generation
+        self.signals = SpanSignals()
+
+    def run(self):
+        """ 
+        Executado em uma thread do pool: calcula os spans e emite o resultado. 
+        """
+
+        spans = self.compute(self.vertices, self.height)
+        self.signals.finished.emit(spans, self.generation)
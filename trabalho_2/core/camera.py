@@ -1,5 +1,6 @@
 import math
-from OpenGL.GLU import *
+import numpy as np
+from OpenGL.GL import *
 from core.vector3d import Vector3D
 
 
@@ -16,6 +17,8 @@ class Camera:
         angle_y (float): Ângulo horizontal em graus (0 a 360)
     """
     
+    __slots__ = ('distance', 'angle_x', 'angle_y', '_cache_key', '_cache_pos', '_cache_view')
+    
     def __init__(self, distance=8.0):
         """
         Inicializa a câmera.
@@ -26,34 +29,78 @@ class Camera:
         self.distance = distance
         self.angle_x = 0  # Vertical
         self.angle_y = 0  # Horizontal
+        
+        # Última posição/matriz view calculadas e os parâmetros (angle_x, angle_y, distance) que as geraram
+        self._cache_key = None
+        self._cache_pos = None
+        self._cache_view = None
+    
+    def _update_cache(self):
+        """
+        Recalcula posição e matriz view quando ângulos ou distância mudam.
+        
+        Os mesmos senos/cossenos servem para as duas: com alvo na origem e up = (0, 1, 0),
+        a base da câmera sai direto das coordenadas esféricas, sem o caminho genérico do gluLookAt.
+        """
+        key = (self.angle_x, self.angle_y, self.distance)
+        if key == self._cache_key:
+            return
+        
+        rad_x = math.radians(self.angle_x)
+        rad_y = math.radians(self.angle_y)
+        cx, sx = math.cos(rad_x), math.sin(rad_x)
+        cy, sy = math.cos(rad_y), math.sin(rad_y)
+        
+        x = self.distance * sy * cx
+        y = self.distance * sx
+        z = self.distance * cy * cx
+        
+        # Linhas: right, up e -forward (forward = -posição normalizada); a câmera fica a "distance" da origem
+        view = np.array([
+            [cy, 0.0, -sy, 0.0],
+            [-sy * sx, cx, -cy * sx, 0.0],
+            [sy * cx, sx, cy * cx, -self.distance],
+            [0.0, 0.0, 0.0, 1.0],
+        ], dtype=np.float32)
+        
+        self._cache_key = key
+        self._cache_pos = Vector3D(x, y, z)
+        self._cache_view = np.ascontiguousarray(view.T)  # coluna-major para o OpenGL
     
     def get_position(self):
         """
         Calcula a posição atual da câmera em coordenadas cartesianas.
         
+        A posição só é recalculada quando ângulos ou distância mudam.
+        
         Returns:
             Vector3D: Posição da câmera
         """
-        rad_x = math.radians(self.angle_x)
-        rad_y = math.radians(self.angle_y)
+        self._update_cache()
+        return self._cache_pos
+    
+    def get_view_matrix(self):
+        """
+        Retorna a matriz view da câmera (4x4, row-major), a mesma usada em apply().
         
-        x = self.distance * math.sin(rad_y) * math.cos(rad_x)
-        y = self.distance * math.sin(rad_x)
-        z = self.distance * math.cos(rad_y) * math.cos(rad_x)
+        Também só é recalculada quando ângulos ou distância mudam.
         
-        return Vector3D(x, y, z)
+        Returns:
+            np.array: Matriz view (4x4)
+        """
+        self._update_cache()
+        return self._cache_view.T
     
     def apply(self):
         """
-        Aplica a transformação da câmera usando gluLookAt.
+        Aplica a transformação da câmera, equivalente a
+        gluLookAt(posição, origem, up = (0, 1, 0)).
         
-        Converte coordenadas esféricas em cartesianas para posicionar
-        a câmera e configura a matriz de visualização do OpenGL.
+        Multiplica a matriz modelview atual pela matriz view
+        montada a partir das coordenadas esféricas.
         """
-        pos = self.get_position()
-        gluLookAt(pos.x, pos.y, pos.z,  # Posição da câmera
-                  0, 0, 0,               # Olhando para origem
-                  0, 1, 0)               # Vetor up
+        self._update_cache()
+        glMultMatrixf(self._cache_view)
     
     def rotate(self, delta_x, delta_y):
         """
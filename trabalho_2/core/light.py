@@ -1,3 +1,4 @@
+import numpy as np
 from OpenGL.GL import *
 from core.vector3d import Vector3D
 
@@ -6,6 +7,9 @@ class Light:
     """
     Classe que representa uma fonte de luz na cena.
     
+    Os valores enviados ao glLightfv ficam pré-alocados em arrays float32 de
+    4 posições, atualizados só quando a propriedade correspondente muda.
+    
     Attributes:
         position (Vector3D): Posição da luz no espaço 3D
         ambient (list): Cor da luz ambiente [R, G, B]
@@ -13,6 +17,10 @@ class Light:
         specular (list): Cor da luz especular [R, G, B]
     """
     
+    # position/ambient/diffuse/specular são properties; só os campos internos ocupam slots
+    __slots__ = ('_pos4', '_position', '_amb4', '_diff4', '_spec4',
+                 '_ambient', '_diffuse', '_specular')
+    
     def __init__(self, position=None):
         """
         Inicializa uma fonte de luz.
@@ -20,11 +28,58 @@ class Light:
         Args:
             position (Vector3D, optional): Posição inicial da luz
         """
+        # w=1 para luz posicional; position é uma view das 3 primeiras posições,
+        # então alterar position.x/y/z já atualiza o array enviado ao OpenGL
+        self._pos4 = np.array([0.0, 0.0, 0.0, 1.0], dtype=np.float32)
+        self._position = Vector3D.from_array(self._pos4[:3])
+        self._amb4 = np.ones(4, dtype=np.float32)
+        self._diff4 = np.ones(4, dtype=np.float32)
+        self._spec4 = np.ones(4, dtype=np.float32)
+        
         self.position = position if position else Vector3D(3.0, 3.0, 3.0)
         self.ambient = [0.2, 0.2, 0.2]
         self.diffuse = [0.8, 0.8, 0.8]
         self.specular = [1.0, 1.0, 1.0]
     
+    @property
+    def position(self):
+        """Posição da luz no espaço 3D."""
+        return self._position
+    
+    @position.setter
+    def position(self, value):
+        self._pos4[:3] = value.to_list()
+    
+    @property
+    def ambient(self):
+        """Cor da luz ambiente [R, G, B]."""
+        return self._ambient
+    
+    @ambient.setter
+    def ambient(self, value):
+        self._ambient = list(value)
+        self._amb4[:3] = value
+    
+    @property
+    def diffuse(self):
+        """Cor da luz difusa [R, G, B]."""
+        return self._diffuse
+    
+    @diffuse.setter
+    def diffuse(self, value):
+        self._diffuse = list(value)
+        self._diff4[:3] = value
+    
+    @property
+    def specular(self):
+        """Cor da luz especular [R, G, B]."""
+        return self._specular
+    
+    @specular.setter
+    def specular(self, value):
+        self._specular = list(value)
+        self._spec4[:3] = value
+    
     def apply_fixed_pipeline(self, light_id=GL_LIGHT0):
         """
         Aplica as propriedades da luz ao pipeline fixo do OpenGL.
@@ -33,8 +88,7 @@ class Light:
         Args:
             light_id: Identificador da luz OpenGL (GL_LIGHT0, GL_LIGHT1, etc.)
         """
-        pos = self.position.to_list() + [1.0]  # w=1 para luz posicional
-        glLightfv(light_id, GL_POSITION, pos)
-        glLightfv(light_id, GL_AMBIENT, self.ambient + [1.0])
-        glLightfv(light_id, GL_DIFFUSE, self.diffuse + [1.0])
-        glLightfv(light_id, GL_SPECULAR, self.specular + [1.0])
\ No newline at end of file
+        glLightfv(light_id, GL_POSITION, self._pos4)
+        glLightfv(light_id, GL_AMBIENT, self._amb4)
+        glLightfv(light_id, GL_DIFFUSE, self._diff4)
+        glLightfv(light_id, GL_SPECULAR, self._spec4)
\ No newline at end of file
@@ -1,3 +1,4 @@
+import numpy as np
 from OpenGL.GL import *
 
 
@@ -5,6 +6,9 @@ class Material:
     """
     Classe que representa as propriedades de material de um objeto.
     
+    Os valores enviados ao glMaterialfv ficam pré-alocados em arrays float32
+    de 4 posições (RGBA), atualizados só quando a cor correspondente muda.
+    
     Attributes:
         ambient (list): Reflexão ambiente [R, G, B]
         diffuse (list): Reflexão difusa [R, G, B]
@@ -12,19 +16,56 @@ class Material:
         shininess (float): Expoente de brilho especular (0-128)
     """
     
+    # ambient/diffuse/specular são properties; só os campos internos ocupam slots
+    __slots__ = ('_amb4', '_diff4', '_spec4', '_ambient', '_diffuse', '_specular', 'shininess')
+    
     def __init__(self):
         """Inicializa um material com propriedades padrão."""
+        self._amb4 = np.ones(4, dtype=np.float32)
+        self._diff4 = np.ones(4, dtype=np.float32)
+        self._spec4 = np.ones(4, dtype=np.float32)
+        
         self.ambient = [0.2, 0.2, 0.2]
         self.diffuse = [0.8, 0.8, 0.8]
         self.specular = [1.0, 1.0, 1.0]
         self.shininess = 16.0
     
+    @property
+    def ambient(self):
+        """Reflexão ambiente [R, G, B]."""
+        return self._ambient
+    
+    @ambient.setter
+    def ambient(self, value):
+        self._ambient = list(value)
+        self._amb4[:3] = value
+    
+    @property
+    def diffuse(self):
+        """Reflexão difusa [R, G, B]."""
+        return self._diffuse
+    
+    @diffuse.setter
+    def diffuse(self, value):
+        self._diffuse = list(value)
+        self._diff4[:3] = value
+    
+    @property
+    def specular(self):
+        """Reflexão especular [R, G, B]."""
+        return self._specular
+    
+    @specular.setter
+    def specular(self, value):
+        self._specular = list(value)
+        self._spec4[:3] = value
+    
     def apply_fixed_pipeline(self):
         """
         Aplica as propriedades do material ao pipeline fixo do OpenGL.
         Usado para Flat e Gouraud shading.
         """
-        glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, self.ambient + [1.0])
-        glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, self.diffuse + [1.0])
-        glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, self.specular + [1.0])
+        glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, self._amb4)
+        glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, self._diff4)
+        glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, self._spec4)
         glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, self.shininess)
\ No newline at end of file
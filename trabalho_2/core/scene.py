@@ -21,7 +21,7 @@ class Scene3D:
         camera (Camera): Câmera da cena
         light (Light): Fonte de luz
         material (Material): Material dos objetos
-        objects (dict): Dicionário de objetos 3D disponíveis
+        objects (dict): Objetos 3D já construídos (criados na primeira seleção)
         shading_models (dict): Dicionário de modelos de iluminação
         current_object (str): Chave do objeto atual
         current_shading (str): Chave do modelo de iluminação atual
@@ -33,13 +33,14 @@ class Scene3D:
         self.light = Light()
         self.material = Material()
         
-        # Criar objetos disponíveis
-        self.objects = {
-            'cube': Cube(),
-            'pyramid': Pyramid(),
-            'cone': Cone(),
-            'sphere': Sphere()
+        # Objetos disponíveis: cada um só é construído quando selecionado pela primeira vez
+        self._object_factories = {
+            'cube': Cube,
+            'pyramid': Pyramid,
+            'cone': Cone,
+            'sphere': Sphere
         }
+        self.objects = {}
         
         # Criar modelos de iluminação
         self.shading_models = {
@@ -57,7 +58,7 @@ class Scene3D:
     
     def get_object(self, key=None):
         """
-        Retorna o objeto geométrico.
+        Retorna o objeto geométrico, construindo-o no primeiro acesso.
         
         Args:
             key (str, optional): Chave do objeto. Se None, usa current_object
@@ -67,7 +68,12 @@ class Scene3D:
         """
         if key is None:
             key = self.current_object
-        return self.objects.get(key)
+        if key not in self.objects:
+            factory = self._object_factories.get(key)
+            if factory is None:
+                return None
+            self.objects[key] = factory()
+        return self.objects[key]
     
     def get_shading(self, key=None):
         """
@@ -1,16 +1,23 @@
 import math
+import numpy as np
 
 
 class Vector3D:
     """
     Classe para representar e manipular vetores 3D.
     
+    Os componentes ficam em um array NumPy float32 de 3 posições, de modo que
+    cada operação (dot, cross, normalize) é uma única chamada vetorizada.
+    
     Attributes:
         x (float): Componente X do vetor
         y (float): Componente Y do vetor
         z (float): Componente Z do vetor
     """
     
+    # Sem __dict__ por instância: o único atributo é o array dos componentes
+    __slots__ = ('_v',)
+    
     def __init__(self, x=0.0, y=0.0, z=0.0):
         """
         Inicializa um vetor 3D.
@@ -20,9 +27,67 @@ class Vector3D:
             y (float): Componente Y
             z (float): Componente Z
         """
-        self.x = x
-        self.y = y
-        self.z = z
+        self._v = np.array([x, y, z], dtype=np.float32)
+    
+    @classmethod
+    def from_array(cls, array):
+        """
+        Cria um vetor a partir de um array de 3 posições, sem copiar componente a componente.
+        
+        Args:
+            array (np.array): Array com [x, y, z]
+            
+        Returns:
+            Vector3D: Novo vetor
+        """
+        vector = cls.__new__(cls)
+        vector._v = np.asarray(array, dtype=np.float32)
+        return vector
+    
+    @classmethod
+    def batch_normals(cls, apex, base):
+        """
+        Calcula de uma vez as normais das faces triangulares (apex, base[i], base[i+1]).
+        
+        Args:
+            apex (list): Vértice comum a todas as faces
+            base (list): Vértices da base, em ordem
+            
+        Returns:
+            np.array: Normais normalizadas, uma linha (3,) por face
+        """
+        apex = np.asarray(apex, dtype=np.float32)
+        base = np.asarray(base, dtype=np.float32)
+        normals = np.cross(base - apex, np.roll(base, -1, axis=0) - apex)
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        return np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+    
+    @property
+    def x(self):
+        """Componente X do vetor."""
+        return self._v[0]
+    
+    @x.setter
+    def x(self, value):
+        self._v[0] = value
+    
+    @property
+    def y(self):
+        """Componente Y do vetor."""
+        return self._v[1]
+    
+    @y.setter
+    def y(self, value):
+        self._v[1] = value
+    
+    @property
+    def z(self):
+        """Componente Z do vetor."""
+        return self._v[2]
+    
+    @z.setter
+    def z(self, value):
+        self._v[2] = value
     
     def normalize(self):
         """
@@ -31,10 +96,11 @@ class Vector3D:
         Returns:
             Vector3D: Vetor normalizado
         """
-        length = math.sqrt(self.x**2 + self.y**2 + self.z**2)
-        if length > 0:
-            return Vector3D(self.x/length, self.y/length, self.z/length)
-        return Vector3D(0, 0, 0)
+        # math.hypot em C sai mais barato que np.linalg.norm para só 3 componentes;
+        # vetor nulo continua virando (0, 0, 0)
+        length = math.hypot(*self._v.tolist())
+        inv = 1.0 / length if length else 0.0
+        return Vector3D.from_array(self._v * inv)
     
     def dot(self, other):
         """
@@ -46,7 +112,7 @@ class Vector3D:
         Returns:
             float: Produto escalar
         """
-        return self.x * other.x + self.y * other.y + self.z * other.z
+        return float(np.dot(self._v, other._v))
     
     def cross(self, other):
         """
@@ -58,15 +124,23 @@ class Vector3D:
         Returns:
             Vector3D: Vetor resultante do produto vetorial
         """
-        return Vector3D(
-            self.y * other.z - self.z * other.y,
-            self.z * other.x - self.x * other.z,
-            self.x * other.y - self.y * other.x
-        )
+        return Vector3D.from_array(np.cross(self._v, other._v))
+    
+    def __add__(self, other):
+        """
+        Soma outro vetor a este vetor (operador +).
+        
+        Args:
+            other (Vector3D): Vetor a somar
+            
+        Returns:
+            Vector3D: Vetor resultante
+        """
+        return Vector3D.from_array(self._v + other._v)
     
-    def subtract(self, other):
+    def __sub__(self, other):
         """
-        Subtrai outro vetor deste vetor.
+        Subtrai outro vetor deste vetor (operador -).
         
         Args:
             other (Vector3D): Vetor a subtrair
@@ -74,8 +148,25 @@ class Vector3D:
         Returns:
             Vector3D: Vetor resultante
         """
-        return Vector3D(self.x - other.x, self.y - other.y, self.z - other.z)
+        return Vector3D.from_array(self._v - other._v)
+    
+    def __mul__(self, scalar):
+        """
+        Multiplica o vetor por um escalar (operador *).
+        
+        Args:
+            scalar (float): Fator de escala
+            
+        Returns:
+            Vector3D: Vetor resultante
+        """
+        return Vector3D.from_array(self._v * scalar)
+    
+    __rmul__ = __mul__
+    
+    # Forma por extenso mantida por compatibilidade
+    subtract = __sub__
     
     def to_list(self):
         """Converte o vetor para lista [x, y, z]."""
-        return [self.x, self.y, self.z]
\ No newline at end of file
+        return self._v.tolist()
\ No newline at end of file
@@ -1,4 +1,4 @@
-import math
+import numpy as np
 from OpenGL.GL import *
 from geometry.geometry3d import Geometry3D
 
@@ -17,93 +17,78 @@ class Cone(Geometry3D):
         self.segments = 32  # Número de segmentos ao redor
         self.radius = 1.0
         self.height = 2.0
+        self._setup_geometry()
+    
+    def _setup_geometry(self):
+        """Monta o VBO intercalado com o corpo e a base do cone."""
+        self._interleaved = np.concatenate((self._build_body(), self._build_base()))
     
     def draw(self, use_shaders=False):
         """
-        Renderiza o cone manualmente com vértices.
+        Renderiza o cone a partir do VBO.
         
         Args:
             use_shaders (bool): Não usado
         """
-
-        self._draw_body()
-        
-
-        self._draw_base()
+        self._draw_interleaved()
     
-    def _draw_body(self):
-        """Desenha o corpo cônico (lateral) com normais por vértice (suavizadas)."""
-        apex = [0.0, self.height, 0.0]  # Topo do cone
-
-        glBegin(GL_TRIANGLES)
-
-        for i in range(self.segments):
-            # ângulos atual e próximo
-            angle1 = (i / self.segments) * 2.0 * math.pi
-            angle2 = ((i + 1) / self.segments) * 2.0 * math.pi
-
-            # pontos na base
-            x1 = math.cos(angle1) * self.radius
-            z1 = math.sin(angle1) * self.radius
-            x2 = math.cos(angle2) * self.radius
-            z2 = math.sin(angle2) * self.radius
-
-            base1 = [x1, 0.0, z1]
-            base2 = [x2, 0.0, z2]
-
-            # ---- Normal suavizada para base1 ----
-            nx1 = x1 * (self.height / self.radius)
-            ny1 = self.radius
-            nz1 = z1 * (self.height / self.radius)
-            len1 = math.sqrt(nx1*nx1 + ny1*ny1 + nz1*nz1)
-            if len1 > 0.0:
-                nx1 /= len1
-                ny1 /= len1
-                nz1 /= len1
-
-            # ---- Normal suavizada para base2 ----
-            nx2 = x2 * (self.height / self.radius)
-            ny2 = self.radius
-            nz2 = z2 * (self.height / self.radius)
-            len2 = math.sqrt(nx2*nx2 + ny2*ny2 + nz2*nz2)
-            if len2 > 0.0:
-                nx2 /= len2
-                ny2 /= len2
-                nz2 /= len2
-
-            # ---- Normal para o ápice ----
-            # o ápice é singular; usar vetor médio/para cima costuma ficar bem
-            # aqui uso uma normal voltada para cima (pode ajustar se quiser outro efeito)
-            na = [0.0, 1.0, 0.0]
-
-            # Escrever triângulo (cada vértice com sua normal)
-            glNormal3f(nx1, ny1, nz1)
-            glVertex3fv(base1)
-
-            glNormal3f(nx2, ny2, nz2)
-            glVertex3fv(base2)
-
-            glNormal3f(na[0], na[1], na[2])
-            glVertex3fv(apex)
-
-        glEnd()
-
+    def _build_body(self):
+        """
+        Triângulos do corpo cônico (lateral) com normais por vértice (suavizadas).
+        
+        Returns:
+            np.array: Linhas (px, py, pz, nx, ny, nz), 3 por segmento
+        """
+        n = self.segments
+        
+        # Tabela de seno/cosseno calculada uma vez; o ponto "próximo" de cada
+        # segmento é o da posição seguinte da tabela (np.roll)
+        angles = np.linspace(0.0, 2.0 * np.pi, n, endpoint=False)
+        xs = np.cos(angles) * self.radius
+        zs = np.sin(angles) * self.radius
+        
+        # ---- Normais suavizadas de cada ponto da base ----
+        k = self.height / self.radius
+        normals = np.stack((xs * k, np.full(n, self.radius), zs * k), axis=1)
+        length = np.linalg.norm(normals, axis=1, keepdims=True)
+        normals = np.divide(normals, length, out=normals, where=length > 0.0)
+        
+        points = np.stack((xs, np.zeros(n), zs), axis=1)
+        
+        body = np.zeros((n, 3, 6), dtype=np.float32)
+        body[:, 0, 0:3] = points
+        body[:, 0, 3:6] = normals
+        body[:, 1, 0:3] = np.roll(points, -1, axis=0)
+        body[:, 1, 3:6] = np.roll(normals, -1, axis=0)
+        
+        # ---- Ápice ----
+        # o ápice é singular; usar vetor médio/para cima costuma ficar bem
+        # aqui uso uma normal voltada para cima (pode ajustar se quiser outro efeito)
+        body[:, 2, 1] = self.height
+        body[:, 2, 4] = 1.0
+        
+        return body.reshape(-1, 6)
     
-    def _draw_base(self):
-        """Desenha a base circular do cone."""
-        glBegin(GL_TRIANGLE_FAN)
+    def _build_base(self):
+        """
+        Triângulos da base circular do cone (leque em volta do centro).
         
-        # Normal apontando para baixo
-        glNormal3f(0, -1, 0)
+        Returns:
+            np.array: Linhas (px, py, pz, nx, ny, nz), 3 por segmento
+        """
+        n = self.segments
+        
+        # Vértices ao redor da base (-z para inverter winding)
+        angle = np.arange(n + 1) / n * 2 * np.pi
+        ring = np.stack((np.cos(angle) * self.radius,
+                         np.zeros(n + 1),
+                         -np.sin(angle) * self.radius), axis=1)
         
-        # Centro da base
-        glVertex3f(0, 0, 0)
+        base = np.zeros((n, 3, 6), dtype=np.float32)
+        base[:, 1, 0:3] = ring[:-1]
+        base[:, 2, 0:3] = ring[1:]
         
-        # Vértices ao redor da base (invertido para face correta)
-        for i in range(self.segments + 1):
-            angle = (i / self.segments) * 2 * math.pi
-            x = math.cos(angle) * self.radius
-            z = math.sin(angle) * self.radius
-            glVertex3f(x, 0, -z)  # -z para inverter winding
+        # Normal apontando para baixo
+        base[:, :, 4] = -1.0
         
-        glEnd()
\ No newline at end of file
+        return base.reshape(-1, 6)
\ No newline at end of file
@@ -1,3 +1,4 @@
+import numpy as np
 from OpenGL.GL import *
 from geometry.geometry3d import Geometry3D
 
@@ -16,7 +17,7 @@ class Cube(Geometry3D):
         self._setup_geometry()
     
     def _setup_geometry(self):
-        """Define os vértices, faces e normais do cubo."""
+        """Define os vértices, faces e normais do cubo e monta o VBO intercalado."""
         self.vertices = [
             [-1, -1, -1], [1, -1, -1], [1, 1, -1], [-1, 1, -1],  # Traseira
             [-1, -1, 1], [1, -1, 1], [1, 1, 1], [-1, 1, 1]       # Frontal
@@ -39,6 +40,17 @@ class Cube(Geometry3D):
             [-1, 0, 0],   # Esquerda
             [1, 0, 0]     # Direita
         ]
+        
+        # 4 vértices por face, na ordem de desenho de GL_QUADS. Os quads não são
+        # triangulados: no Flat Shading a face inteira continua com a cor do seu
+        # último vértice, em vez de cada metade ter a cor de um canto diferente
+        self._interleaved = np.empty((len(self.faces) * 4, 6), dtype=np.float32)
+        row = 0
+        for i, face in enumerate(self.faces):
+            for vertex_idx in face:
+                self._interleaved[row, 0:3] = self.vertices[vertex_idx]
+                self._interleaved[row, 3:6] = self.normals[i]
+                row += 1
     
     def draw(self, use_shaders=False):
         """
@@ -47,9 +59,4 @@ class Cube(Geometry3D):
         Args:
             use_shaders (bool): Não usado para geometria simples
         """
-        glBegin(GL_QUADS)
-        for i, face in enumerate(self.faces):
-            glNormal3fv(self.normals[i])
-            for vertex_idx in face:
-                glVertex3fv(self.vertices[vertex_idx])
-        glEnd()
\ No newline at end of file
+        self._draw_interleaved(GL_QUADS)
\ No newline at end of file
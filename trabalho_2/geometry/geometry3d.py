@@ -1,10 +1,20 @@
+import ctypes
+import numpy as np
+from OpenGL.GL import *
+
+
 class Geometry3D:
     """
     Classe base abstrata para objetos geométricos 3D.
     
     Define a interface comum para todos os objetos 3D renderizáveis.
+    Subclasses que preenchem self._interleaved (linhas px, py, pz, nx, ny, nz)
+    podem desenhar com _draw_interleaved, que envia tudo em um único VBO.
     """
     
+    # Bytes por vértice no VBO intercalado: 6 floats (posição + normal)
+    _STRIDE = 6 * 4
+    
     def __init__(self, name):
         """
         Inicializa a geometria.
@@ -13,6 +23,41 @@ class Geometry3D:
             name (str): Nome do objeto geométrico
         """
         self.name = name
+        self._interleaved = None
+        self._vbo = None
+    
+    def _draw_interleaved(self, mode=GL_TRIANGLES, parts=None):
+        """
+        Desenha self._interleaved a partir de um VBO.
+        
+        O VBO é criado no primeiro desenho, pois os objetos são construídos
+        antes de existir um contexto OpenGL.
+        
+        Args:
+            mode: Primitiva OpenGL formada pelos vértices (GL_TRIANGLES, GL_QUADS...)
+            parts (tuple, optional): Trechos (primitiva, primeiro vértice, quantidade) para
+                desenhar partes do mesmo VBO com primitivas diferentes. Se None, desenha
+                o array inteiro com mode.
+        """
+        if self._vbo is None:
+            self._vbo = glGenBuffers(1)
+            glBindBuffer(GL_ARRAY_BUFFER, self._vbo)
+            glBufferData(GL_ARRAY_BUFFER, self._interleaved.nbytes, self._interleaved, GL_STATIC_DRAW)
+        else:
+            glBindBuffer(GL_ARRAY_BUFFER, self._vbo)
+        
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glVertexPointer(3, GL_FLOAT, self._STRIDE, ctypes.c_void_p(0))
+        glNormalPointer(GL_FLOAT, self._STRIDE, ctypes.c_void_p(12))
+        if parts is None:
+            glDrawArrays(mode, 0, len(self._interleaved))
+        else:
+            for part_mode, first, count in parts:
+                glDrawArrays(part_mode, first, count)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
     
     def draw(self, use_shaders=False):
         """
@@ -1,7 +1,40 @@
+import math
+import numpy as np
 from OpenGL.GL import *
 from geometry.geometry3d import Geometry3D
 from core.vector3d import Vector3D
 
+# Trechos do VBO intercalado: 4 faces laterais (12 vértices) e a base quadrada (4 vértices)
+_PARTS = ((GL_TRIANGLES, 0, 12), (GL_QUADS, 12, 4))
+
+# Numba é opcional: sem ele o caminho dinâmico usa _calc_normal em Python puro
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _calc_normal(ax, ay, az, bx, by, bz, cx, cy, cz):
+    """
+    Normal normalizada do triângulo (a, b, c) só com escalares, no formato que o Numba compila (@njit).
+    Mesmo resultado de Pyramid._calculate_normal, sem criar objetos Vector3D.
+    
+    Returns:
+        tuple: Normal (nx, ny, nz); (0, 0, 0) para triângulo degenerado
+    """
+    ux, uy, uz = bx - ax, by - ay, bz - az
+    vx, vy, vz = cx - ax, cy - ay, cz - az
+    nx = uy * vz - uz * vy
+    ny = uz * vx - ux * vz
+    nz = ux * vy - uy * vx
+    length = math.sqrt(nx * nx + ny * ny + nz * nz)
+    inv = 1.0 / length if length > 0.0 else 0.0
+    return nx * inv, ny * inv, nz * inv
+
+
+# Versão compilada (ou a própria função em Python quando o Numba não está instalado)
+_calc_normal_fast = njit(cache=True, fastmath=True)(_calc_normal) if njit is not None else _calc_normal
+
 
 class Pyramid(Geometry3D):
     """
@@ -9,15 +42,20 @@ class Pyramid(Geometry3D):
     
     Pirâmide com vértice superior e base quadrada,
     composta por 4 faces triangulares e 1 base quadrada.
+    
+    Attributes:
+        dynamic (bool): Se True, apex/base podem mudar entre quadros e as
+            normais e o VBO são refeitos a cada desenho
     """
     
     def __init__(self):
         """Inicializa a pirâmide."""
         super().__init__("Pyramid")
+        self.dynamic = False
         self._setup_geometry()
     
     def _setup_geometry(self):
-        """Define os vértices e faces da pirâmide."""
+        """Define os vértices e faces da pirâmide, pré-calcula as normais e monta o VBO intercalado."""
         self.apex = [0, 1.5, 0]
         self.base = [
             [-1, -0.5, 1],
@@ -25,6 +63,31 @@ class Pyramid(Geometry3D):
             [1, -0.5, -1],
             [-1, -0.5, -1]
         ]
+        
+        # A pirâmide é rígida: as normais das faces laterais são constantes
+        self._face_normals = [
+            self._calculate_normal(self.apex, self.base[i], self.base[(i + 1) % 4])
+            for i in range(4)
+        ]
+        
+        self._build_interleaved()
+    
+    def _build_interleaved(self):
+        """Monta self._interleaved a partir de apex, base e das normais das faces."""
+        rows = []
+        
+        # Faces laterais triangulares
+        for i in range(4):
+            next_i = (i + 1) % 4
+            for vertex in (self.apex, self.base[i], self.base[next_i]):
+                rows.append(list(vertex) + list(self._face_normals[i]))
+        
+        # Base quadrada (percorrida ao contrário), mantida como GL_QUADS: dividida em
+        # 2 triângulos, o Flat iluminaria cada metade em um vértice diferente
+        for vertex in reversed(self.base):
+            rows.append(list(vertex) + [0, -1, 0])
+        
+        self._interleaved = np.array(rows, dtype=np.float32)
     
     def _calculate_normal(self, p1, p2, p3):
         """
@@ -41,6 +104,19 @@ class Pyramid(Geometry3D):
         normal = v1.cross(v2).normalize()
         return normal.to_list()
     
+    def _update_dynamic(self):
+        """Recalcula as normais das faces com _calc_normal_fast e reenvia os vértices ao VBO."""
+        self._face_normals = [
+            _calc_normal_fast(*self.apex, *self.base[i], *self.base[(i + 1) % 4])
+            for i in range(4)
+        ]
+        self._build_interleaved()
+        
+        if self._vbo is not None:
+            glBindBuffer(GL_ARRAY_BUFFER, self._vbo)
+            glBufferSubData(GL_ARRAY_BUFFER, 0, self._interleaved.nbytes, self._interleaved)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+    
     def draw(self, use_shaders=False):
         """
         Renderiza a pirâmide usando OpenGL.
@@ -48,20 +124,6 @@ class Pyramid(Geometry3D):
         Args:
             use_shaders (bool): Não usado para geometria simples
         """
-        # Faces laterais triangulares
-        glBegin(GL_TRIANGLES)
-        for i in range(4):
-            next_i = (i + 1) % 4
-            normal = self._calculate_normal(self.apex, self.base[i], self.base[next_i])
-            glNormal3fv(normal)
-            glVertex3fv(self.apex)
-            glVertex3fv(self.base[i])
-            glVertex3fv(self.base[next_i])
-        glEnd()
-        
-        # Base quadrada
-        glBegin(GL_QUADS)
-        glNormal3f(0, -1, 0)
-        for vertex in reversed(self.base):
-            glVertex3fv(vertex)
-        glEnd()
\ No newline at end of file
+        if self.dynamic:
+            self._update_dynamic()
+        self._draw_interleaved(parts=_PARTS)
\ No newline at end of file
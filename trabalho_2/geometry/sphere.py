@@ -8,21 +8,38 @@ class Sphere(Geometry3D):
     Implementação de uma esfera 3D usando GLU.
     
     Esfera com raio 1.2 e subdivisões suaves.
-    Usa quadrics do GLU para gerar geometria suave.
+    Usa quadrics do GLU para gerar geometria suave, tesselada uma única vez
+    em uma display list compartilhada por todas as instâncias.
     """
     
+    # Display list da malha (atributo de classe: uma tesselação por processo)
+    _list = None
+    
     def __init__(self):
         """Inicializa a esfera."""
         super().__init__("Sphere")
     
-    def draw(self, use_shaders=False):
+    def _compile(self):
         """
-        Renderiza a esfera usando GLU quadrics.
+        Grava a tesselação do GLU em uma display list.
         
-        Args:
-            use_shaders (bool): Não usado para GLU quadrics
+        Feito no primeiro desenho, pois a esfera é criada antes de existir um contexto OpenGL.
         """
+        Sphere._list = glGenLists(1)
+        glNewList(Sphere._list, GL_COMPILE)
         quadric = gluNewQuadric()
         gluQuadricNormals(quadric, GLU_SMOOTH)
         gluSphere(quadric, 1.2, 32, 32)
-        gluDeleteQuadric(quadric)
\ No newline at end of file
+        gluDeleteQuadric(quadric)
+        glEndList()
+    
+    def draw(self, use_shaders=False):
+        """
+        Renderiza a esfera chamando a display list.
+        
+        Args:
+            use_shaders (bool): Não usado para GLU quadrics
+        """
+        if Sphere._list is None:
+            self._compile()
+        glCallList(Sphere._list)
\ No newline at end of file
@@ -1,10 +1,37 @@
+from functools import partial
+from operator import attrgetter
+
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QLabel, QSlider, QComboBox,
                              QGroupBox, QGridLayout)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, QSignalBlocker
 
 from gui.opengl_widget import OpenGLWidget
 
+# Texto exibido nos comboboxes -> identificador interno usado pela cena/widget
+_OBJ_MAP = {
+    'Cubo': 'cube', 
+    'Pirâmide': 'pyramid', 
+    'Cone': 'cone', 
+    'Esfera': 'sphere'
+}
+
+_SHADE_MAP = {
+    'Flat': 'flat', 
+    'Gouraud': 'gouraud', 
+    'Phong': 'phong'
+}
+
+_PROJ_MAP = {
+    'Perspectiva': 'perspective', 
+    'Ortográfica': 'orthographic'
+}
+
+# Mesmos identificadores na ordem dos itens, indexados por currentIndexChanged
+_OBJ_KEYS = tuple(_OBJ_MAP.values())
+_SHADE_KEYS = tuple(_SHADE_MAP.values())
+_PROJ_KEYS = tuple(_PROJ_MAP.values())
+
 
 class MainWindow(QMainWindow):
     """
@@ -29,6 +56,7 @@ class MainWindow(QMainWindow):
         scale_slider (QSlider): Controle de escala
         light_x_slider, light_y_slider, light_z_slider (QSlider): Controles de luz
         animate_btn (QPushButton): Botão de animação
+        _repaint_timer (QTimer): Timer single-shot que agrupa os repaints pedidos pelos sliders
     """
     
     def __init__(self):
@@ -52,6 +80,15 @@ class MainWindow(QMainWindow):
         self.gl_widget.setFocus() 
         main_layout.addWidget(self.gl_widget, 3)
         
+        # Conectado uma única vez: start_animation só age enquanto gl_widget.animate for True
+        self.gl_widget.timer.timeout.connect(self.start_animation)
+        
+        # Repaint agrupado: durante o arrasto de um slider, no máximo um update() a cada 16 ms
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self.gl_widget.update)
+        
         # Painel de controle (25% da largura)
         control_panel = self.create_control_panel()
         main_layout.addWidget(control_panel, 1)
@@ -98,8 +135,8 @@ class MainWindow(QMainWindow):
         object_layout = QVBoxLayout()
         
         self.object_combo = QComboBox()
-        self.object_combo.addItems(['Cubo', 'Pirâmide', 'Cone', 'Esfera'])
-        self.object_combo.currentTextChanged.connect(self.change_object)
+        self.object_combo.addItems(list(_OBJ_MAP))
+        self.object_combo.currentIndexChanged.connect(self.change_object)
         object_layout.addWidget(QLabel("Tipo:"))
         object_layout.addWidget(self.object_combo)
         
@@ -111,9 +148,9 @@ class MainWindow(QMainWindow):
         lighting_layout = QVBoxLayout()
         
         self.shading_combo = QComboBox()
-        self.shading_combo.addItems(['Flat', 'Gouraud', 'Phong'])
+        self.shading_combo.addItems(list(_SHADE_MAP))
         self.shading_combo.setCurrentIndex(1)  # Gouraud default
-        self.shading_combo.currentTextChanged.connect(self.change_shading)
+        self.shading_combo.currentIndexChanged.connect(self.change_shading)
         lighting_layout.addWidget(QLabel("Modelo:"))
         lighting_layout.addWidget(self.shading_combo)
         
@@ -126,8 +163,8 @@ class MainWindow(QMainWindow):
         projection_layout = QVBoxLayout()
         
         self.projection_combo = QComboBox()
-        self.projection_combo.addItems(['Perspectiva', 'Ortográfica'])
-        self.projection_combo.currentTextChanged.connect(self.change_projection)
+        self.projection_combo.addItems(list(_PROJ_MAP))
+        self.projection_combo.currentIndexChanged.connect(self.change_projection)
         projection_layout.addWidget(QLabel("Tipo:"))
         projection_layout.addWidget(self.projection_combo)
         
@@ -140,17 +177,17 @@ class MainWindow(QMainWindow):
         
         self.rot_x_label = QLabel("X: 30°")
         rotation_layout.addWidget(self.rot_x_label, 0, 0)
-        self.rot_x_slider = self.create_slider(0, 360, 30, self.update_rotation_x)
+        self.rot_x_slider = self.create_slider(0, 360, 30, partial(self._on_slider, 'rot_x'))
         rotation_layout.addWidget(self.rot_x_slider, 0, 1)
         
         self.rot_y_label = QLabel("Y: 45°")
         rotation_layout.addWidget(self.rot_y_label, 1, 0)
-        self.rot_y_slider = self.create_slider(0, 360, 45, self.update_rotation_y)
+        self.rot_y_slider = self.create_slider(0, 360, 45, partial(self._on_slider, 'rot_y'))
         rotation_layout.addWidget(self.rot_y_slider, 1, 1)
         
         self.rot_z_label = QLabel("Z: 0°")
         rotation_layout.addWidget(self.rot_z_label, 2, 0)
-        self.rot_z_slider = self.create_slider(0, 360, 0, self.update_rotation_z)
+        self.rot_z_slider = self.create_slider(0, 360, 0, partial(self._on_slider, 'rot_z'))
         rotation_layout.addWidget(self.rot_z_slider, 2, 1)
         
         rotation_group.setLayout(rotation_layout)
@@ -162,7 +199,9 @@ class MainWindow(QMainWindow):
         
         self.scale_label = QLabel("Escala: 1.0x")
         scale_layout.addWidget(self.scale_label)
-        self.scale_slider = self.create_slider(10, 200, 100, self.update_scale)
+        self.scale_slider = self.create_slider(10, 200, 100, partial(self._on_slider, 'scale'),
+                                               tracking=False,
+                                               label_callback=partial(self._update_slider_label, 'scale'))
         scale_layout.addWidget(self.scale_slider)
         
         scale_group.setLayout(scale_layout)
@@ -174,17 +213,23 @@ class MainWindow(QMainWindow):
         
         self.light_x_label = QLabel("X: 3.0")
         light_layout.addWidget(self.light_x_label, 0, 0)
-        self.light_x_slider = self.create_slider(-50, 50, 30, self.update_light_x)
+        self.light_x_slider = self.create_slider(-50, 50, 30, partial(self._on_slider, 'light_x'),
+                                                   tracking=False,
+                                                   label_callback=partial(self._update_slider_label, 'light_x'))
         light_layout.addWidget(self.light_x_slider, 0, 1)
         
         self.light_y_label = QLabel("Y: 3.0")
         light_layout.addWidget(self.light_y_label, 1, 0)
-        self.light_y_slider = self.create_slider(-50, 50, 30, self.update_light_y)
+        self.light_y_slider = self.create_slider(-50, 50, 30, partial(self._on_slider, 'light_y'),
+                                                   tracking=False,
+                                                   label_callback=partial(self._update_slider_label, 'light_y'))
         light_layout.addWidget(self.light_y_slider, 1, 1)
         
         self.light_z_label = QLabel("Z: 3.0")
         light_layout.addWidget(self.light_z_label, 2, 0)
-        self.light_z_slider = self.create_slider(-50, 50, 30, self.update_light_z)
+        self.light_z_slider = self.create_slider(-50, 50, 30, partial(self._on_slider, 'light_z'),
+                                                   tracking=False,
+                                                   label_callback=partial(self._update_slider_label, 'light_z'))
         light_layout.addWidget(self.light_z_slider, 2, 1)
         
         light_group.setLayout(light_layout)
@@ -204,13 +249,44 @@ class MainWindow(QMainWindow):
         layout.addLayout(btn_layout)
         layout.addStretch()
         
+        # Tabela dos sliders usada por _on_slider:
+        # chave -> (objeto alvo a partir da janela, atributo, label, divisor do valor, formato do label)
+        widget = attrgetter('gl_widget')
+        light = attrgetter('gl_widget.scene.light.position')
+        self._slider_specs = {
+            'rot_x': (widget, 'rotation_x', self.rot_x_label, 1, "X: {:.0f}°"),
+            'rot_y': (widget, 'rotation_y', self.rot_y_label, 1, "Y: {:.0f}°"),
+            'rot_z': (widget, 'rotation_z', self.rot_z_label, 1, "Z: {:.0f}°"),
+            'scale': (widget, 'scale_factor', self.scale_label, 100.0, "Escala: {:.1f}x"),
+            'light_x': (light, 'x', self.light_x_label, 10.0, "X: {:.1f}"),
+            'light_y': (light, 'y', self.light_y_label, 10.0, "Y: {:.1f}"),
+            'light_z': (light, 'z', self.light_z_label, 10.0, "Z: {:.1f}"),
+        }
+        
+        # Textos dos labels pré-formatados para cada valor possível de cada slider:
+        # chave -> (valor mínimo do slider, tupla de textos indexada por valor - mínimo)
+        sliders = {
+            'rot_x': self.rot_x_slider, 'rot_y': self.rot_y_slider, 'rot_z': self.rot_z_slider,
+            'scale': self.scale_slider,
+            'light_x': self.light_x_slider, 'light_y': self.light_y_slider, 'light_z': self.light_z_slider,
+        }
+        self._slider_label_table = {}
+        for key, slider in sliders.items():
+            _, _, _, divisor, fmt = self._slider_specs[key]
+            values = range(slider.minimum(), slider.maximum() + 1)
+            self._slider_label_table[key] = (slider.minimum(),
+                                             tuple(fmt.format(v / divisor) for v in values))
+        
+        # Último texto escrito em cada label (evita setText quando nada muda)
+        self._slider_label_text = {}
+        
         return panel
     
     # ========================================================================
     # MÉTODOS AUXILIARES
     # ========================================================================
     
-    def create_slider(self, min_val, max_val, default, callback):
+    def create_slider(self, min_val, max_val, default, callback, tracking=True, label_callback=None):
         """
         Cria um slider horizontal configurado.
         
@@ -219,6 +295,8 @@ class MainWindow(QMainWindow):
             max_val (int): Valor máximo do slider
             default (int): Valor inicial do slider
             callback (callable): Função a ser chamada quando o valor muda
+            tracking (bool): Se False, durante o arrasto o callback só é chamado ao soltar o slider
+            label_callback (callable, optional): Chamado a cada movimento do arrasto, para manter o label atualizado
             
         Returns:
             QSlider: Slider configurado e conectado ao callback
@@ -230,148 +308,104 @@ class MainWindow(QMainWindow):
         slider.setMinimum(min_val)
         slider.setMaximum(max_val)
         slider.setValue(default)
+        slider.setTracking(tracking)
         slider.valueChanged.connect(callback)
+        if label_callback is not None:
+            slider.sliderMoved.connect(label_callback)
         return slider
     
+    def schedule_repaint(self):
+        """
+        Agenda um único repaint do widget OpenGL para daqui a 16 ms.
+        
+        Chamadas repetidas enquanto o timer está ativo não agendam nada novo,
+        então uma rajada de valueChanged de um slider vira um só update().
+        """
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+    
     # ========================================================================
     # CALLBACKS DOS CONTROLES
     # ========================================================================
     
-    def change_object(self, text):
+    def change_object(self, index):
         """
         Altera o tipo de objeto a ser renderizado.
         
         Args:
-            text (str): Nome do objeto em português ('Cubo', 'Pirâmide', 'Cone', 'Esfera')
+            index (int): Índice do item no combobox ('Cubo', 'Pirâmide', 'Cone', 'Esfera')
             
-        Converte o texto da interface para o identificador interno
+        Converte o índice da interface para o identificador interno
         e atualiza o widget OpenGL.
         """
-        obj_map = {
-            'Cubo': 'cube', 
-            'Pirâmide': 'pyramid', 
-            'Cone': 'cone', 
-            'Esfera': 'sphere'
-        }
-        self.gl_widget.scene.current_object = obj_map[text]
+        self.gl_widget.scene.current_object = _OBJ_KEYS[index]
         self.gl_widget.update()
     
-    def change_shading(self, text):
+    def change_shading(self, index):
         """
         Altera o modelo de iluminação/sombreamento.
         
         Args:
-            text (str): Nome do modelo ('Flat', 'Gouraud', 'Phong')
+            index (int): Índice do modelo no combobox ('Flat', 'Gouraud', 'Phong')
             
         Atualiza o modelo de sombreamento usado na renderização.
         - Flat: sombreamento uniforme por face
         - Gouraud: interpolação de cores nos vértices
         - Phong: interpolação de normais (cálculo por pixel com shaders)
         """
-        shade_map = {
-            'Flat': 'flat', 
-            'Gouraud': 'gouraud', 
-            'Phong': 'phong'
-        }
-        self.gl_widget.scene.current_shading = shade_map[text]
+        self.gl_widget.scene.current_shading = _SHADE_KEYS[index]
         self.gl_widget.update()
     
-    def change_projection(self, text):
+    def change_projection(self, index):
         """
         Altera o tipo de projeção da cena.
         
         Args:
-            text (str): Tipo de projeção ('Perspectiva', 'Ortográfica')
+            index (int): Índice da projeção no combobox ('Perspectiva', 'Ortográfica')
             
         - Perspectiva: objetos mais distantes aparecem menores (realista)
         - Ortográfica: linhas paralelas permanecem paralelas (técnico)
         """
-        proj_map = {
-            'Perspectiva': 'perspective', 
-            'Ortográfica': 'orthographic'
-        }
-        self.gl_widget.set_projection_type(proj_map[text])
+        self.gl_widget.set_projection_type(_PROJ_KEYS[index])
     
-    def update_rotation_x(self, value):
+    def _update_slider_label(self, key, value):
         """
-        Atualiza a rotação do objeto no eixo X.
+        Atualiza só o label de um slider (também chamado durante o arrasto dos sliders sem tracking).
         
         Args:
-            value (int): Ângulo de rotação em graus (0-360)
+            key (str): Chave do slider em self._slider_specs
+            value (int): Valor bruto do slider
             
-        Atualiza tanto o objeto OpenGL quanto o label que mostra o valor atual.
-        """
-        self.gl_widget.rotation_x = value
-        self.rot_x_label.setText(f"X: {value}°")
-        self.gl_widget.update()
+        O texto vem da tabela pré-formatada (sem formatação durante o arrasto) e o
+        setText só acontece se ele mudou (na escala, por exemplo, 10 valores seguidos
+        do slider mostram o mesmo "Escala: 1.0x").
+        """
+        label = self._slider_specs[key][2]
+        minimum, texts = self._slider_label_table[key]
+        text = texts[value - minimum]
+        if self._slider_label_text.get(key) == text:
+            return
+        self._slider_label_text[key] = text
+        label.setText(text)
     
-    def update_rotation_y(self, value):
+    def _on_slider(self, key, value):
         """
-        Atualiza a rotação do objeto no eixo Y.
+        Callback único de todos os sliders de rotação, escala e luz.
         
         Args:
-            value (int): Ângulo de rotação em graus (0-360)
-        """
-        self.gl_widget.rotation_y = value
-        self.rot_y_label.setText(f"Y: {value}°")
-        self.gl_widget.update()
-    
-    def update_rotation_z(self, value):
-        """
-        Atualiza a rotação do objeto no eixo Z.
-        
-        Args:
-            value (int): Ângulo de rotação em graus (0-360)
-        """
-        self.gl_widget.rotation_z = value
-        self.rot_z_label.setText(f"Z: {value}°")
-        self.gl_widget.update()
-    
-    def update_scale(self, value):
-        """
-        Atualiza o fator de escala do objeto.
-        
-        Args:
-            value (int): Valor do slider (10-200), convertido para fator (0.1-2.0)
+            key (str): Chave do slider em self._slider_specs
+            value (int): Valor do slider
             
-        Um valor de 100 corresponde à escala normal (1.0x).
-        """
-        self.gl_widget.scale_factor = value / 100.0
-        self.scale_label.setText(f"Escala: {value/100:.1f}x")
-        self.gl_widget.update()
-    
-    def update_light_x(self, value):
-        """
-        Atualiza a posição X da fonte de luz.
+        Rotação: graus (0-360), direto.
+        Escala: 10-200, dividido por 100 (100 corresponde à escala normal 1.0x).
+        Luz: -50 a 50, dividido por 10 (coordenada de -5.0 a 5.0).
         
-        Args:
-            value (int): Valor do slider (-50 a 50), convertido para coordenada (-5.0 a 5.0)
+        Grava o valor convertido no atributo alvo, atualiza o label e agenda o repaint.
         """
-        self.gl_widget.scene.light.position.x = value / 10.0
-        self.light_x_label.setText(f"X: {value/10:.1f}")
-        self.gl_widget.update()
-    
-    def update_light_y(self, value):
-        """
-        Atualiza a posição Y da fonte de luz.
-        
-        Args:
-            value (int): Valor do slider (-50 a 50), convertido para coordenada (-5.0 a 5.0)
-        """
-        self.gl_widget.scene.light.position.y = value / 10.0
-        self.light_y_label.setText(f"Y: {value/10:.1f}")
-        self.gl_widget.update()
-    
-    def update_light_z(self, value):
-        """
-        Atualiza a posição Z da fonte de luz.
-        
-        Args:
-            value (int): Valor do slider (-50 a 50), convertido para coordenada (-5.0 a 5.0)
-        """
-        self.gl_widget.scene.light.position.z = value / 10.0
-        self.light_z_label.setText(f"Z: {value/10:.1f}")
-        self.gl_widget.update()
+        target, attr, _, divisor, _ = self._slider_specs[key]
+        setattr(target(self), attr, value / divisor)
+        self._update_slider_label(key, value)
+        self.schedule_repaint()
     
     def toggle_animation(self):
         """
@@ -392,19 +426,25 @@ class MainWindow(QMainWindow):
             self.gl_widget.animate = True
             self.gl_widget.timer.start(16)  # ~60 FPS
             self.animate_btn.setText("⏸ Parar Animação")
-            # Conectar o timer ao método de animação
-            self.gl_widget.timer.timeout.connect(self.start_animation)
     
     def start_animation(self):
         """
         Incrementa a rotação Y do objeto para criar animação.
         
         Chamado pelo timer a cada frame quando a animação está ativa.
-        Incrementa a rotação em 2° por frame e atualiza o slider correspondente.
-        """
-        if self.gl_widget.animate:
-            self.gl_widget.rotation_y = (self.gl_widget.rotation_y + 2) % 360
-            self.rot_y_slider.setValue(int(self.gl_widget.rotation_y))
+        Incrementa a rotação em 2° por frame e espelha o valor no slider e no label.
+        
+        O slider é atualizado com sinais bloqueados para não passar de novo por
+        _on_slider; o repaint vem da própria conexão timer.timeout -> update do widget.
+        """
+        gl = self.gl_widget
+        if not gl.animate:
+            return
+        gl.rotation_y = (gl.rotation_y + 2) % 360
+        value = int(gl.rotation_y)
+        with QSignalBlocker(self.rot_y_slider):
+            self.rot_y_slider.setValue(value)
+        self._update_slider_label('rot_y', value)
     
     def reset_view(self):
         """
@@ -417,24 +457,28 @@ class MainWindow(QMainWindow):
         - Ângulos da câmera para 0° (vista frontal)
         - Todos os sliders para posições correspondentes
         """
-        self.gl_widget.rotation_x = 30
-        self.gl_widget.rotation_y = 45
-        self.gl_widget.rotation_z = 0
-        self.gl_widget.scale_factor = 1.0
-
-        # Resetar translação para a origem
-        self.gl_widget.translation_x = 0.0
-        self.gl_widget.translation_y = 0.0
-        self.gl_widget.translation_z = 0.0
+        # Rotação, escala e translação (para a origem) numa única chamada
+        self.gl_widget.update_state(
+            rotation_x=30, rotation_y=45, rotation_z=0, scale_factor=1.0,
+            translation_x=0.0, translation_y=0.0, translation_z=0.0
+        )
 
         self.gl_widget.scene.camera.distance = 8.0
         self.gl_widget.scene.camera.angle_x = 0
         self.gl_widget.scene.camera.angle_y = 0
         
-        self.rot_x_slider.setValue(30)
-        self.rot_y_slider.setValue(45)
-        self.rot_z_slider.setValue(0)
-        self.scale_slider.setValue(100)
+        # Sliders com sinais bloqueados: o estado já foi gravado acima, então
+        # só os labels são atualizados e a vista é redesenhada uma única vez
+        with QSignalBlocker(self.rot_x_slider), QSignalBlocker(self.rot_y_slider), \
+                QSignalBlocker(self.rot_z_slider), QSignalBlocker(self.scale_slider):
+            self.rot_x_slider.setValue(30)
+            self.rot_y_slider.setValue(45)
+            self.rot_z_slider.setValue(0)
+            self.scale_slider.setValue(100)
+        
+        for key, slider in (('rot_x', self.rot_x_slider), ('rot_y', self.rot_y_slider),
+                            ('rot_z', self.rot_z_slider), ('scale', self.scale_slider)):
+            self._update_slider_label(key, slider.value())
         
         self.gl_widget.update()
 
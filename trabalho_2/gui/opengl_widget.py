@@ -70,6 +70,13 @@ class OpenGLWidget(QOpenGLWidget):
         # Interação com mouse
         self.last_pos = None
         
+        # Display list da esfera que marca a fonte de luz (gravada no primeiro desenho)
+        self._light_marker_list = None
+        
+        # Matriz modelo em cache e as transformações com que ela foi calculada
+        self._model_matrix = None
+        self._model_key = None
+        
     def initializeGL(self):
         """
         Inicializa o contexto OpenGL e configura o estado inicial.
@@ -227,6 +234,33 @@ class OpenGLWidget(QOpenGLWidget):
         glPopMatrix()
     
 
+    def update_state(self, **changes):
+        """
+        Altera de uma vez vários atributos de transformação do objeto (ex.: reset_view da MainWindow).
+        Para um único atributo basta a atribuição direta.
+        
+        Args:
+            **changes: Pares atributo=valor (ex.: rotation_x=30, scale_factor=1.5)
+            
+        Não chama update(): quem altera o estado decide quando redesenhar.
+        """
+        for attr, value in changes.items():
+            setattr(self, attr, value)
+    
+    def _get_model_matrix(self):
+        """
+        Retorna a matriz modelo, recalculando só se alguma transformação mudou.
+        
+        A validade do cache é conferida pelos próprios valores das transformações
+        (e não por flags), pois os atributos são públicos e podem ser escritos direto.
+        """
+        key = (self.rotation_x, self.rotation_y, self.rotation_z, self.scale_factor,
+               self.translation_x, self.translation_y, self.translation_z)
+        if key != self._model_key:
+            self._model_matrix = self._build_model_matrix()
+            self._model_key = key
+        return self._model_matrix
+    
     def _build_model_matrix(self, extra_translation=(0.0, 0.0, 0.0), extra_scale=1.0):
         """
         Constrói a matriz modelo (apenas transformações do objeto),
@@ -286,32 +320,6 @@ class OpenGLWidget(QOpenGLWidget):
         # Mesma composição que no OpenGL (T * Rx * Ry * Rz * S)
         return T @ Rx @ Ry @ Rz @ S
 
-    def _build_view_matrix(self):
-        """
-        Constrói a matriz de visualização (view) equivalente ao gluLookAt da câmera orbital.
-        """
-        cam_pos = self.scene.camera.get_position()
-        eye = np.array([cam_pos.x, cam_pos.y, cam_pos.z], dtype=np.float32)
-        center = np.array([0.0, 0.0, 0.0], dtype=np.float32)
-        up = np.array([0.0, 1.0, 0.0], dtype=np.float32)
-
-        f = center - eye
-        f = f / np.linalg.norm(f)
-        u = up / np.linalg.norm(up)
-        s = np.cross(f, u)
-        s = s / np.linalg.norm(s)
-        u = np.cross(s, f)
-
-        view = np.identity(4, dtype=np.float32)
-        view[0, 0:3] = s
-        view[1, 0:3] = u
-        view[2, 0:3] = -f
-        view[0, 3] = -np.dot(s, eye)
-        view[1, 3] = -np.dot(u, eye)
-        view[2, 3] =  np.dot(f, eye)
-        return view
-
-    
     def _setup_phong_uniforms(self, phong_shading,
                               extra_translation=(0.0, 0.0, 0.0),
                               extra_scale=1.0):
@@ -324,11 +332,14 @@ class OpenGLWidget(QOpenGLWidget):
         Args:
             phong_shading (PhongShading): Instância do modelo Phong
         """
-        # Matriz modelo: transformações do objeto no mundo
-        model_matrix = self._build_model_matrix(extra_translation, extra_scale)
+        # Matriz modelo: transformações do objeto no mundo (em cache se não houver extras)
+        if extra_translation == (0.0, 0.0, 0.0) and extra_scale == 1.0:
+            model_matrix = self._get_model_matrix()
+        else:
+            model_matrix = self._build_model_matrix(extra_translation, extra_scale)
 
-        # Matriz de visualização da câmera
-        view_matrix = self._build_view_matrix()
+        # Matriz de visualização da câmera (em cache na própria câmera)
+        view_matrix = self.scene.camera.get_view_matrix()
 
         # Matriz de projeção atual
         proj_matrix = np.array(glGetFloatv(GL_PROJECTION_MATRIX), dtype=np.float32)
@@ -361,10 +372,15 @@ class OpenGLWidget(QOpenGLWidget):
         pos = self.scene.light.position
         glTranslatef(pos.x, pos.y, pos.z)
         
-        # Desenhar esfera pequena
-        quadric = gluNewQuadric()
-        gluSphere(quadric, 0.15, 10, 10)
-        gluDeleteQuadric(quadric)
+        # Desenhar esfera pequena (tesselada uma vez só)
+        if self._light_marker_list is None:
+            self._light_marker_list = glGenLists(1)
+            glNewList(self._light_marker_list, GL_COMPILE)
+            quadric = gluNewQuadric()
+            gluSphere(quadric, 0.15, 10, 10)
+            gluDeleteQuadric(quadric)
+            glEndList()
+        glCallList(self._light_marker_list)
         
         glPopMatrix()
         glEnable(GL_LIGHTING)
@@ -380,15 +396,18 @@ class OpenGLWidget(QOpenGLWidget):
         glUseProgram(0)
         glColor3f(0.3, 0.3, 0.3)  # Cinza escuro
         
+        # Nome local: o laço faz LOAD_FAST em vez de buscar glVertex3f no módulo a cada vértice
+        vertex = glVertex3f
+        
         glBegin(GL_LINES)
         size = 5
         for i in range(-size, size + 1):
             # Linhas paralelas ao eixo X
-            glVertex3f(-size, 0, i)
-            glVertex3f(size, 0, i)
+            vertex(-size, 0, i)
+            vertex(size, 0, i)
             # Linhas paralelas ao eixo Z
-            glVertex3f(i, 0, -size)
-            glVertex3f(i, 0, size)
+            vertex(i, 0, -size)
+            vertex(i, 0, size)
         glEnd()
         
         glEnable(GL_LIGHTING)